@@ -392,12 +392,26 @@ def response_exists() -> bool:
     return os.path.exists(response_path())
 
 
+_response_cache = (None, None)   # ((mtime_ns, size), parsed response)
+
+
 def read_response() -> dict:
-    """Read and parse Claude's response file."""
-    if not os.path.exists(response_path()):
+    """Read and parse Claude's response file.
+
+    The parsed dict is kept while the file's mtime and size are unchanged,
+    so repeated imports of the same file skip the read and parse; treat
+    the result as read-only."""
+    global _response_cache
+    path = response_path()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         return None
-    with open(response_path(), "r", encoding="utf-8") as f:
-        return json.load(f)
+    key = (st.st_mtime_ns, st.st_size)
+    if _response_cache[0] != key:
+        with open(path, "r", encoding="utf-8") as f:
+            _response_cache = (key, json.load(f))
+    return _response_cache[1]
 
 
 # ─────────────────────────────────────────────────────
@@ -693,6 +693,7 @@ def resolve_round_attack(combat: CombatState) -> dict:
     """
     Resolve one full round where player chose ATTACK.
     BX-PLUG section 6.2.4: initiative -> attacks -> morale.
+    Leaves combat.ended set if the round ended the fight.
     """
     _log(combat, f"--- Round {combat.round_number}: ATTACK ---")
 
@@ -731,6 +732,9 @@ def resolve_round_attack(combat: CombatState) -> dict:
                 foe.is_broken = True
                 _log(combat, f"Morale: {foe.name} — 2d6={mr['roll']} vs ML={mr['target']} -> FAIL (BROKEN)")
 
+    # 5. End conditions — sets combat.ended / end_reason for the caller
+    check_combat_end(combat)
+
     summary = _round_summary(round_events, triggers, morale_results)
     return {
         "round": combat.round_number,
@@ -523,7 +523,7 @@ def build_session_summary(state) -> CreativeRequest:
 
     # Companions with PC (from NPC list, not CompanionDetail)
     companions = [
-        {"name": n.name, "status": n.status, "zone": getattr(n, "zone", "")}
+        {"name": n.name, "status": n.status, "zone": n.zone}
         for n in state.npcs.values() if n.is_companion and n.with_pc
     ]
 
@@ -1913,6 +1913,7 @@ def _apply_state_change(state, req_id: str, change: dict) -> Optional[dict]:
             encounter_threshold=change.get("encounter_threshold", 6),
         )
         state.zones[name] = zone
+        state._zone_version += 1
         return {"applied": "zone_create", "zone": name}
 
     elif change_type == "zone_update":
@@ -1931,6 +1932,7 @@ def _apply_state_change(state, req_id: str, change: dict) -> Optional[dict]:
         for cp in new_cps:
             if cp not in zone.crossing_points:
                 zone.crossing_points.append(cp)
+        state._zone_version += 1
         return {"applied": "zone_update", "zone": name}
 
     return None
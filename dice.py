@@ -5,6 +5,22 @@ Full audit trail on every roll. No hidden rolls per BX-PLUG §0.2.
 
 import random
 import re
+from functools import lru_cache
+
+_DICE_RE = re.compile(r'(\d+)d(\d+)([+-]\d+)?')
+
+
+@lru_cache(maxsize=128)
+def _parse_dice(expression: str):
+    """Parse NdM+K into (n, faces, k), or None if invalid. The engine rolls
+    the same handful of expressions every day, so parses are cached."""
+    match = _DICE_RE.match(expression.strip().lower())
+    if not match:
+        return None
+    n = int(match.group(1))
+    m = int(match.group(2))
+    k = int(match.group(3)) if match.group(3) else 0
+    return n, range(1, m + 1), k
 
 
 def roll_dice(expression: str, label: str = "") -> dict:
@@ -12,18 +28,13 @@ def roll_dice(expression: str, label: str = "") -> dict:
     Roll a dice expression like '2d6', '1d8+2', '2d6+3'.
     Returns dict with full audit trail.
     """
-    expr = expression.strip().lower()
-
-    # Parse NdM+K
-    match = re.match(r'(\d+)d(\d+)([+-]\d+)?', expr)
-    if not match:
+    parsed = _parse_dice(expression)
+    if parsed is None:
         return {"error": f"Invalid dice expression: {expression}"}
+    n, faces, k = parsed
 
-    n = int(match.group(1))
-    m = int(match.group(2))
-    k = int(match.group(3)) if match.group(3) else 0
-
-    individual = [random.randint(1, m) for _ in range(n)]
+    # All n dice in one C-level call
+    individual = random.choices(faces, k=n)
     total = sum(individual) + k
 
     result = {
@@ -52,6 +63,14 @@ def roll_d20(label: str = "") -> dict:
     return roll_dice("1d20", label)
 
 
+_GATE_THRESHOLDS = {
+    "low": 2,
+    "medium": 3,
+    "high": 4,
+    "extreme": 6,
+}
+
+
 def intensity_gate_check(intensity: str, roll_result: int) -> bool:
     """
     Check if a 1d6 roll passes the intensity gate.
@@ -61,13 +80,7 @@ def intensity_gate_check(intensity: str, roll_result: int) -> bool:
       high: 1-4 pass
       extreme: auto-pass
     """
-    thresholds = {
-        "low": 2,
-        "medium": 3,
-        "high": 4,
-        "extreme": 6,
-    }
-    threshold = thresholds.get(intensity.lower(), 3)
+    threshold = _GATE_THRESHOLDS.get(intensity.lower(), 3)
     return roll_result <= threshold
 
 
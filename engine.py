@@ -877,8 +877,8 @@ def _zone_gap_check(state: GameState) -> dict:
     # NPC deficit — same threshold as zone_forge (<=3)
     active_npcs = [
         n for n in state.npcs.values()
-        if getattr(n, "zone", "") == zone_name
-        and getattr(n, "status", "") == "active"
+        if n.zone == zone_name
+        and n.status == "active"
     ]
     if len(active_npcs) <= 3:
         deficit = max(1, 4 - len(active_npcs))
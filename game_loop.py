@@ -10,15 +10,23 @@ State machine:
   NARRATE         -> Display narration and updated state. Transition to IDLE.
 """
 
+import functools
 import json
+import mmap
 import os
-import glob
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from datetime import datetime
+from operator import itemgetter
 from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
 
 from dataclasses import asdict as _asdict
-from models import GameState, state_to_json, state_from_json
+from models import GameState, state_to_json_bytes, state_from_json
 from engine import run_day, clock_audit, evaluate_halt_conditions
 from travel import get_crossing_points, execute_travel, validate_travel
 from creative_bridge import (
@@ -40,6 +48,122 @@ from combat import (
 from zone_forge import run_zone_forge
 from report import generate_session_report
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+# Cap on in-memory narration history
+LOG_HISTORY_MAX = 2000
+# Action log entries kept in memory for the UI; the full log goes to disk
+ACTION_LOG_TAIL = 100
+# Pending action log lines that trigger a flush to disk
+LOG_FLUSH_EVERY = 64
+# Session reports kept in memory by get_session_report
+REPORT_CACHE_MAX = 8
+# Payloads up to this size skip the buffered file object (_write_small)
+SMALL_WRITE_MAX = 64 * 1024
+# On-disk action log ring in the data dir, and its size
+LOG_RING_FILE = "action_log.ring"
+LOG_RING_SIZE = 8 * 1024 * 1024
+
+
+def _tail(buf: deque, n: int) -> list:
+    """Last n items of a deque, indexed from the right end (no full copy)."""
+    return [buf[i] for i in range(-min(n, len(buf)), 0)]
+
+
+def _scan_saves(data_dir: str) -> list:
+    """Save files in data_dir (save_*.json, Session *.json), newest first.
+
+    One scandir pass; each DirEntry caches its stat() result.
+    """
+    with os.scandir(data_dir) as it:
+        ents = [e for e in it
+                if e.name.endswith(".json")
+                and e.name.startswith(("save_", "Session "))
+                and e.is_file()]
+    ents.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return ents
+
+
+def _without_llm_requests(day_logs: list) -> list:
+    """Shallow copies of day_logs minus the bulky llm_requests key."""
+    out = []
+    for dl in day_logs:
+        d = dl.copy(); d.pop("llm_requests", None)
+        out.append(d)
+    return out
+
+
+def _clock_ui_dict(c) -> dict:
+    """Clock row for the web UI."""
+    return {
+        "name": c.name, "owner": c.owner,
+        "progress": c.progress, "max_progress": c.max_progress,
+        "status": c.status, "is_cadence": c.is_cadence,
+        "trigger_fired": c.trigger_fired,
+        "trigger_text": c.trigger_on_completion,
+    }
+
+
+_iso_last: tuple = (None, "")
+
+
+def _iso(ts: float) -> str:
+    """datetime.fromtimestamp(ts).isoformat(), memoized for the most recent
+    ts — entries logged within one engine tick share their timestamp."""
+    global _iso_last
+    last = _iso_last
+    if last[0] == ts:
+        return last[1]
+    text = datetime.fromtimestamp(ts).isoformat()
+    _iso_last = (ts, text)
+    return text
+
+
+class LogEntry(NamedTuple):
+    """One action log entry. Kept as a tuple; the UI dict is built on demand.
+
+    detail is either the final string or a lazy (fmt, *args) tuple that is
+    only %-formatted when the entry is actually displayed or written.
+    """
+    type: str
+    detail: str | tuple
+    date: str
+    timestamp: float        # epoch seconds
+
+    @property
+    def text(self) -> str:
+        detail = self.detail
+        if type(detail) is tuple:
+            return detail[0] % detail[1:]
+        return detail
+
+    def ui_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "detail": self.text,
+            "timestamp": _iso(self.timestamp),
+            "date": self.date,
+        }
+
+
+def _mutates(method):
+    """Bump GameLoop._state_rev around a state-mutating method. Bumped on
+    entry so an _auto_save inside the method sees a dirty state, and on exit
+    so a snapshot taken mid-method is never reused afterwards."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._state_rev += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._state_rev += 1
+            self._tick_ts = None        # in case a T&P day loop raised
+    return wrapper
+
 
 class GamePhase(str, Enum):
     IDLE = "idle"
@@ -50,14 +174,228 @@ class GamePhase(str, Enum):
     IN_COMBAT = "in_combat"          # DG-16: BX-PLUG combat active
 
 
-class _EngineEncoder(json.JSONEncoder):
+def _engine_default(obj):
     """Handle CreativeRequest (and other dataclass) objects in day_log steps."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if hasattr(obj, '__dataclass_fields__'):
+        return _asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _EngineEncoder(json.JSONEncoder):
+    """stdlib fallback for _engine_default when orjson is not installed."""
     def default(self, obj):
-        if hasattr(obj, 'to_dict'):
-            return obj.to_dict()
-        if hasattr(obj, '__dataclass_fields__'):
-            return _asdict(obj)
-        return super().default(obj)
+        try:
+            return _engine_default(obj)
+        except TypeError:
+            return super().default(obj)
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to path via a sibling temp file + os.replace, so readers
+    never see a truncated file. The temp name is per-thread because the
+    auto-save writer and save_game can target the same path."""
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    if len(data) <= SMALL_WRITE_MAX:
+        _write_small(tmp, data)
+    else:
+        with open(tmp, "wb") as f:
+            f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_small(path: str, data: bytes):
+    """Write a small payload with raw os.open/os.write — no buffered file
+    object. os.write may write short, so loop until everything is out."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _dumps_engine(payload) -> bytes:
+    """Encode an engine payload (day logs, request batches) to JSON bytes."""
+    if _orjson:
+        return _orjson.dumps(payload, default=_engine_default,
+                             option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False,
+                      cls=_EngineEncoder).encode("utf-8")
+
+
+# ─────────────────────────────────────────────────
+# T&P DAY LOG LINES — one handler per run_day step,
+# each called as handler(step_name, step, result, add)
+# ─────────────────────────────────────────────────
+
+def _tp_log_date_advance(sn, step, r, add):
+    if r.get("season_changed"):
+        add(("DATE", f"{r['new_date']} — SEASON: {r['new_season']}"))
+    else:
+        add(("DATE", r.get("new_date", "?")))
+
+
+def _tp_log_engine(sn, step, r, add):
+    en = sn.split(":", 1)[1]
+    if r.get("skipped") or r.get("status") == "inert":
+        return
+    if "roll" in r:
+        add(("ENGINE",
+             f"{en}: 2d6={r['roll']['total']} -> {r.get('outcome_band', '')}"))
+        for ce in r.get("clock_effects_applied", []):
+            if not ce.get("skipped") and "error" not in ce:
+                add(("CLOCK_ADVANCE",
+                     f"{ce['clock']}: {ce.get('old', '?')}->{ce.get('new', '?')}"))
+
+
+def _tp_log_cadence_clocks(sn, step, r, add):
+    for cr in step.get("results", []):
+        if "error" not in cr:
+            if cr.get("action") == "cadence_eligible_for_audit":
+                add(("CADENCE",
+                     f"{cr['clock']}: audit-eligible (no cadence_bullet)"))
+            else:
+                add(("CADENCE",
+                     f"{cr['clock']}: {cr['old']}->{cr['new']}/{cr['max']}"))
+                if cr.get("trigger_fired"):
+                    add(("TRIGGER", f"FIRED: {cr.get('trigger_text', '')}"))
+
+
+def _tp_log_clock_audit(sn, step, r, add):
+    for a in r.get("auto_advanced", []):
+        ar = a["advance_result"]
+        add(("CLOCK_AUDIT",
+             f"{a['clock']}: {ar['old']}->{ar['new']}/{ar.get('max', '?')}"))
+    for rv in r.get("needs_llm_review", []):
+        add(("CLOCK_AUDIT",
+             f"{rv['clock']}: needs Claude review "
+             f"({len(rv['ambiguous_bullets'])} bullets)"))
+
+
+def _tp_log_clock_interactions(sn, step, r, add):
+    for flag in r.get("flags", []):
+        add(("TRIGGER",
+             f"INTERACTION {flag['rule']}: {flag['text'][:80]}"))
+    for adv in r.get("advances", []):
+        ar = adv["result"]
+        add(("CLOCK_ADVANCE",
+             f"INTERACTION {adv['rule']}: "
+             f"{ar['clock']}: {ar['old']}->{ar['new']}"))
+    for spawn in r.get("spawns", []):
+        add(("TRIGGER",
+             f"INTERACTION {spawn['rule']}: SPAWNED {spawn['clock']}"))
+
+
+def _tp_log_halt_evaluation(sn, step, r, add):
+    for h in (r if isinstance(r, list) else []):
+        add(("CLOCK_AUDIT",
+             f"HALTED: {h['clock']} \u2014 {h['condition'][:60]}"))
+
+
+def _tp_log_encounter_gate(sn, step, r, add):
+    # Gate results stay dicts (MCP, sampling adapter and pending file read
+    # them by key) — unpack each field once into locals
+    passed, rv, intensity = r["passed"], r["roll"]["total"], r.get("intensity", "?")
+    if passed:
+        enc = r.get("encounter") or {}
+        prompt, reaction = enc.get("prompt", "no table"), enc.get("reaction")
+        add(("ENCOUNTER", ("PASS (d6=%s, %s) -> %.60s", rv, intensity, prompt)))
+        # Log reaction roll if present (BX-PLUG §2.1)
+        if reaction:
+            add(("MECH",
+                 f"Reaction: 2d6={reaction['total']} -> "
+                 f"{reaction['band']}"))
+    else:
+        add(("ENCOUNTER", ("fail (d6=%s, %s)", rv, intensity)))
+
+
+def _tp_log_npag_gate(sn, step, r, add):
+    passed, rv, intensity = r["passed"], r["roll"]["total"], r.get("intensity", "?")
+    if passed:
+        add(("NPAG",
+             ("PASS (d6=%s, %s) -> %s NPCs",
+              rv, intensity, r["npc_count"]["count"])))
+    else:
+        add(("NPAG", ("fail (d6=%s, %s)", rv, intensity)))
+
+
+# Step name -> handler; "engine:<name>" steps go to _tp_log_engine
+_TP_LOG_HANDLERS = {
+    "date_advance": _tp_log_date_advance,
+    "cadence_clocks": _tp_log_cadence_clocks,
+    "clock_audit": _tp_log_clock_audit,
+    "clock_interactions": _tp_log_clock_interactions,
+    "halt_evaluation": _tp_log_halt_evaluation,
+    "encounter_gate": _tp_log_encounter_gate,
+    "npag_gate": _tp_log_npag_gate,
+}
+
+
+class _LogRing:
+    """Fixed-size on-disk ring of JSON log lines, written through mmap.
+
+    Bytes 0-8 hold the next write offset (little-endian). A record that
+    would run past the end wraps to offset 8; the gap it leaves is NUL-filled.
+    Only the auto-save writer thread touches it.
+    """
+    HEADER = 8
+
+    def __init__(self, path: str, size: int = LOG_RING_SIZE):
+        reuse = os.path.exists(path) and os.path.getsize(path) == size
+        self._file = open(path, "r+b" if reuse else "w+b")
+        if not reuse:
+            self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        self.size = size
+        head = int.from_bytes(self._mm[:self.HEADER], "little")
+        self._head = head if self.HEADER <= head <= size else self.HEADER
+
+    def append_many(self, records: list[bytes]):
+        """Write records at the head, then one msync for the whole batch."""
+        mm, head, size = self._mm, self._head, self.size
+        for rec in records:
+            n = len(rec)
+            if n > size - self.HEADER:
+                continue
+            if head + n > size:
+                mm[head:size] = bytes(size - head)
+                head = self.HEADER
+            mm[head:head + n] = rec
+            head += n
+        mm[:self.HEADER] = head.to_bytes(self.HEADER, "little")
+        self._head = head
+        mm.flush()
+
+    @classmethod
+    def read_tail(cls, path: str, n: int) -> list[dict]:
+        """The last n records of the ring file at path, decoded, oldest
+        first. Reads a plain copy of the file, not the writer's mapping."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return []
+        head = int.from_bytes(data[:cls.HEADER], "little")
+        if not cls.HEADER <= head <= len(data):
+            return []
+        # Past head: older records, the first one possibly cut by the last
+        # wrap, then the NUL gap. HEADER..head: the newest records.
+        older = data[head:]
+        cut = older.find(b"\n")
+        older = older[cut + 1:] if cut >= 0 else b""
+        records = []
+        for line in (older + data[cls.HEADER:head]).rsplit(b"\n", n + 1):
+            line = line.strip(b"\0")
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    pass
+        return records[-n:]
 
 
 class GameLoop:
@@ -66,23 +404,56 @@ class GameLoop:
     The web server and MCP server both interact with this object.
     """
 
+    # Characters not allowed in save file names
+    _CANON_SANITIZE = str.maketrans({"/": "-", "\\": "-", ":": "-"})
+
     def __init__(self):
         self.state: GameState = None
         self.phase: GamePhase = GamePhase.IDLE
         self.creative_queue: CreativeQueue = CreativeQueue()
-        self.narration_buffer: list[dict] = []  # [{type, text, timestamp}]
-        self.action_log: list[dict] = []        # Mechanical log entries
+        # Bounded history — oldest entries evict; session summaries keep the rest
+        self.narration_buffer: deque[dict] = deque(maxlen=LOG_HISTORY_MAX)  # [{type, text, timestamp}]
+        self.action_log: deque[LogEntry] = deque(maxlen=ACTION_LOG_TAIL)    # Mechanical log entries (UI tail)
+        self._log_batch: deque[LogEntry] = deque()  # Log entries not yet on disk (writer pops)
+        self._log_ring: _LogRing = None           # opened by the writer on first flush
+        self._tick_ts: float = None               # shared log timestamp for the current T&P day
         self.last_travel: dict = None            # Result of most recent travel
         self.last_tp_logs: list[dict] = []       # T&P day logs from last run
         self.combat_state: CombatState = None    # DG-16: ephemeral combat state
         self._pending_combat_data: dict = None   # DG-16: bx_plug data awaiting combat
         self.active_mode: str = None              # DG-22: INTENS, INTIM, INVESTIG, or None
+        self._report_executor = ThreadPoolExecutor(max_workers=1)  # HTML reports
+        self._report_futures: dict[int, Future] = {}  # session_id -> pending render
+        self._cp_cache: list[dict] = None         # get_crossing_points memo
+        self._cp_cache_key: tuple = None          # (pc_zone, state._zone_version)
+
+        # State revision — bumped by @_mutates methods. Lets auto-save skip
+        # unchanged state and lets serialized output be reused.
+        self._state_rev: int = 0
+        self._last_saved_rev: int = -1
+        self._json_cache: tuple = None            # (state_rev, json bytes)
+        self._report_cache: dict = {}             # session_id -> (state_rev, html)
+        self._full_state_cache: tuple = None      # ((state_rev, phase), dict)
+        self._clock_fill_index: list = None       # [(fill, name)] fullest first
+        self._clock_fill_rev: int = -1            # state_rev the index was built at
+
+        # Background writer: a token in the queue means "something to write"
+        # (a pending save and/or log lines). maxsize=1 coalesces bursts
+        # of requests into one pass. _pending_save holds the latest
+        # (path, bytes) serialized on the loop thread; maxlen=1 drops
+        # older ones, and append/popleft keep the hand-off atomic.
+        self._save_q: queue.Queue = queue.Queue(maxsize=1)
+        self._pending_save: deque[tuple[str, bytes]] = deque(maxlen=1)
+        threading.Thread(target=self._save_worker, name="autosave",
+                         daemon=True).start()
 
         # Callbacks — the web layer registers these to push updates
         self._on_phase_change = None
         self._on_state_update = None
         self._on_narration = None
-        self._on_log_entry = None
+        # Log listeners: the web layer sets a SimpleQueue here and drains
+        # LogEntry items on its own event loop; None means headless
+        self.log_queue: queue.SimpleQueue = None
 
     # ─────────────────────────────────────────────────
     # SHARED PENDING FILE (GameLoop → MCP server v3)
@@ -99,22 +470,21 @@ class GameLoop:
             return
         try:
             batch = self.creative_queue.get_pending_batch()
+            st = self.state
             payload = {
                 "requests": batch.get("requests", []),
                 "state_summary": {
-                    "session_id": self.state.session_id if self.state else "",
-                    "date": self.state.in_game_date if self.state else "",
-                    "zone": self.state.pc_zone if self.state else "",
-                    "season": self.state.season if self.state else "",
+                    "session_id": st.session_id if st else "",
+                    "date": st.in_game_date if st else "",
+                    "zone": st.pc_zone if st else "",
+                    "season": st.season if st else "",
                 },
-                "day_logs": [{k: v for k, v in dl.items() if k != "llm_requests"}
-                             for dl in (self.last_tp_logs or [])],
-                "timestamp": datetime.now().isoformat(),
+                "day_logs": _without_llm_requests(self.last_tp_logs or []),
+                "timestamp": _iso(time.time()),
             }
             path = self._pending_file_path()
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False, cls=_EngineEncoder)
+            _write_atomic(path, _dumps_engine(payload))
         except Exception as e:
             self._log_action("ERROR", f"Failed to write pending file: {e}")
 
@@ -164,6 +534,7 @@ class GameLoop:
     # PLAYER INPUT (Engine Chat — creative queue)
     # ─────────────────────────────────────────────────
 
+    @_mutates
     def receive_player_input(self, intent: str) -> dict:
         """Player types in-character intent via chat panel.
         Routes through creative queue like RUMOR — same pipe, same workflow."""
@@ -179,13 +550,12 @@ class GameLoop:
         self.narration_buffer.append({
             "type": "PLAYER_INPUT",
             "text": intent,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso(time.time()),
         })
 
         # Queue as creative request
         req = build_player_input(self.state, intent, active_mode=self.active_mode)
         self.creative_queue.enqueue(req)
-        self._write_pending_file()
         self._set_phase(GamePhase.AWAIT_CREATIVE)
         self._log_action("CHAT", f"Player: {intent[:80]}")
 
@@ -206,22 +576,31 @@ class GameLoop:
                 os.path.dirname(os.path.abspath(__file__)), "data"
             )
         self._data_dir = data_dir
-        self.state = self._auto_load(data_dir)
+        self._seed_action_log(data_dir)
+        st = self.state = self._auto_load(data_dir)
         self._set_phase(GamePhase.IDLE)
-        self._log_action("SESSION", f"Engine started. Session {self.state.session_id}. "
-                         f"Zone: {self.state.pc_zone}, Date: {self.state.in_game_date}")
+        self._log_action("SESSION", f"Engine started. Session {st.session_id}. "
+                         f"Zone: {st.pc_zone}, Date: {st.in_game_date}")
+
+    def _seed_action_log(self, data_dir: str):
+        """Fill the UI log tail from the previous run's ring file. These
+        entries are already on disk, so they skip _log_batch."""
+        for rec in _LogRing.read_tail(os.path.join(data_dir, LOG_RING_FILE),
+                                      ACTION_LOG_TAIL):
+            try:
+                ts = datetime.fromisoformat(rec["timestamp"]).timestamp()
+                entry = LogEntry(rec["type"], rec["detail"], rec["date"], ts)
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.action_log.append(entry)
 
     def _auto_load(self, data_dir: str) -> GameState:
         """Load the most recent save, or fall back to default state."""
         if os.path.isdir(data_dir):
-            saves = sorted(
-                glob.glob(os.path.join(data_dir, "save_*.json")) +
-                glob.glob(os.path.join(data_dir, "Session *.json")),
-                key=os.path.getmtime, reverse=True,
-            )
-            for save_path in saves:
+            for entry in _scan_saves(data_dir):
+                save_path = entry.path
                 try:
-                    with open(save_path, "r", encoding="utf-8") as f:
+                    with open(save_path, "rb") as f:
                         state = state_from_json(f.read())
                     self._backfill_crossing_points(state)
                     self._backfill_companion_stats(state)
@@ -252,6 +631,8 @@ class GameLoop:
                     state.zones[zone_name].crossing_points = ref_zone.crossing_points
                 else:
                     state.zones[zone_name] = ref_zone
+        state._zone_version += 1
+        self._cp_cache_key = None
 
     def _backfill_companion_stats(self, state: GameState):
         """
@@ -367,23 +748,33 @@ class GameLoop:
     def _set_phase(self, phase: GamePhase):
         old = self.phase
         self.phase = phase
+        if phase == GamePhase.AWAIT_CREATIVE:
+            # MCP reads the queue from this file once we are waiting on it.
+            # Rewritten even when already waiting (post-creative reviews).
+            self._write_pending_file()
+        if self._log_batch and old != phase:
+            self._wake_writer()
         if self._on_phase_change and old != phase:
             self._on_phase_change(phase, self._build_phase_data())
 
     def _build_phase_data(self) -> dict:
         """Data payload for the current phase."""
+        st = self.state
+        phase = self.phase
+        if st is None:
+            return {"phase": phase.value, "zone": "", "date": "", "session_id": 0}
         data = {
-            "phase": self.phase.value,
-            "zone": self.state.pc_zone if self.state else "",
-            "date": self.state.in_game_date if self.state else "",
-            "session_id": self.state.session_id if self.state else 0,
+            "phase": phase.value,
+            "zone": st.pc_zone,
+            "date": st.in_game_date,
+            "session_id": st.session_id,
         }
-        if self.phase == GamePhase.IDLE:
-            data["crossing_points"] = get_crossing_points(self.state)
-        elif self.phase == GamePhase.AWAIT_CREATIVE:
+        if phase == GamePhase.IDLE:
+            data["crossing_points"] = self._crossing_points()
+        elif phase == GamePhase.AWAIT_CREATIVE:
             data["pending_count"] = self.creative_queue.pending_count()
             data["pending_types"] = self.creative_queue.pending_types()
-        elif self.phase == GamePhase.IN_COMBAT:
+        elif phase == GamePhase.IN_COMBAT:
             data["combat"] = (self.combat_state.to_ui_dict()
                               if self.combat_state else {})
         return data
@@ -392,6 +783,7 @@ class GameLoop:
     # PLAYER ACTIONS
     # ─────────────────────────────────────────────────
 
+    @_mutates
     def travel_to(self, destination: str) -> dict:
         """
         Player clicked a CP. Execute the full travel -> T&P -> creative cycle.
@@ -400,12 +792,13 @@ class GameLoop:
         if self.phase != GamePhase.IDLE:
             return {"success": False, "error": f"Cannot travel during {self.phase.value} phase"}
 
-        if not self.state.pc_zone:
+        st = self.state
+        if not st.pc_zone:
             return {"success": False, "error": "PC zone is not set"}
 
         # ── TRAVEL ──
         self._set_phase(GamePhase.TRAVEL)
-        travel_result = execute_travel(self.state, destination)
+        travel_result = execute_travel(st, destination)
 
         if not travel_result["success"]:
             self._set_phase(GamePhase.IDLE)
@@ -421,29 +814,31 @@ class GameLoop:
         days = travel_result["days_traveled"]
         reset_request_counter()
 
-        all_day_logs = []
+        all_day_logs = [None] * days
         all_llm_requests = []
+        convert = self._convert_engine_request
 
         for i in range(days):
+            self._tick_ts = time.time()
             # skip_zone_gap=True: zone_forge handles NPC/EL deficits on arrival
-            day_log = run_day(self.state, skip_zone_gap=True)
+            day_log = run_day(st, skip_zone_gap=True)
             day_log["day_number"] = i + 1
-            all_day_logs.append(day_log)
+            all_day_logs[i] = day_log
 
             # Collect raw LLM requests from engine and convert to CreativeRequests
-            for req in day_log.get("llm_requests", []):
-                creative_req = self._convert_engine_request(req)
-                if creative_req:
-                    all_llm_requests.append(creative_req)
+            all_llm_requests.extend(
+                filter(None, map(convert, day_log.get("llm_requests", ()))))
 
             # Log T&P actions
             self._log_tp_day(day_log)
+        self._tick_ts = None
 
         self.last_tp_logs = all_day_logs
 
         # ── ZONE-FORGE on arrival (DG-13) ──
-        forge_result = run_zone_forge(self.state)
+        forge_result = run_zone_forge(st)
         zone_forge_requests = forge_result.get("forge_requests", [])
+        zone = st.pc_zone
 
         # Log With_PC cohesion moves
         for move in forge_result.get("with_pc_moved", []):
@@ -451,12 +846,12 @@ class GameLoop:
 
         for gap in forge_result.get("gaps", []):
             self._log_action("ZONE_FORGE",
-                             f"Gap in {self.state.pc_zone}: {gap}")
+                             f"Gap in {zone}: {gap}")
 
         if zone_forge_requests:
             self._log_action("ZONE_FORGE",
                              f"{len(zone_forge_requests)} forge requests "
-                             f"for {self.state.pc_zone}")
+                             f"for {zone}")
 
         # Always request arrival narration — include travel context
         travel_info = {
@@ -466,7 +861,7 @@ class GameLoop:
             "days_traveled": travel_result.get("days_traveled", 1),
             "is_eventful": travel_result.get("is_eventful", False),
         }
-        arrival_req = build_narr_arrival(self.state, active_mode=self.active_mode, travel_info=travel_info)
+        arrival_req = build_narr_arrival(st, active_mode=self.active_mode, travel_info=travel_info)
         all_llm_requests.append(arrival_req)
 
         # ── QUEUE CREATIVE REQUESTS ──
@@ -476,7 +871,6 @@ class GameLoop:
         if combined:
             self.creative_queue.clear()
             self.creative_queue.enqueue_many(combined)
-            self._write_pending_file()
             self._set_phase(GamePhase.AWAIT_CREATIVE)
             self._log_action("CREATIVE",
                              f"{len(combined)} requests queued for Claude"
@@ -496,6 +890,7 @@ class GameLoop:
             "creative_pending": self.creative_queue.pending_count(),
         }
 
+    @_mutates
     def rest_days(self, days: int) -> dict:
         """Player voluntarily rests — runs T&P for N days without travel."""
         if self.phase != GamePhase.IDLE:
@@ -509,20 +904,21 @@ class GameLoop:
         self._set_phase(GamePhase.TIME_PRESSURE)
         reset_request_counter()
 
-        all_day_logs = []
+        all_day_logs = [None] * days
         all_llm_requests = []
+        convert = self._convert_engine_request
 
         for i in range(days):
+            self._tick_ts = time.time()
             day_log = run_day(self.state)
             day_log["day_number"] = i + 1
-            all_day_logs.append(day_log)
+            all_day_logs[i] = day_log
 
-            for req in day_log.get("llm_requests", []):
-                creative_req = self._convert_engine_request(req)
-                if creative_req:
-                    all_llm_requests.append(creative_req)
+            all_llm_requests.extend(
+                filter(None, map(convert, day_log.get("llm_requests", ()))))
 
             self._log_tp_day(day_log)
+        self._tick_ts = None
 
         self.last_tp_logs = all_day_logs
         self._log_action("REST", f"Rested {days} day(s) in {self.state.pc_zone}")
@@ -539,7 +935,6 @@ class GameLoop:
         if all_llm_requests:
             self.creative_queue.clear()
             self.creative_queue.enqueue_many(all_llm_requests)
-            self._write_pending_file()
             self._set_phase(GamePhase.AWAIT_CREATIVE)
             self._log_action("CREATIVE",
                              f"{len(all_llm_requests)} requests queued for Claude")
@@ -554,6 +949,7 @@ class GameLoop:
             "creative_pending": self.creative_queue.pending_count(),
         }
 
+    @_mutates
     def receive_creative_response(self, response_json: str) -> dict:
         """
         Claude submitted creative content via MCP.
@@ -586,7 +982,9 @@ class GameLoop:
             "NARR_COMBAT_END", "NARR_ENCOUNTER",
         }
 
-        # Extract narration and handle special response types
+        # Extract narration and handle special response types. One
+        # timestamp for the whole batch.
+        now = _iso(time.time())
         for resp in responses:
             if resp.content and resp.type in CHAT_DISPLAY_TYPES:
                 display_type = resp.type
@@ -595,7 +993,7 @@ class GameLoop:
                 self.narration_buffer.append({
                     "type": display_type,
                     "text": resp.content,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now,
                 })
                 if self._on_narration:
                     self._on_narration(display_type, resp.content)
@@ -607,17 +1005,9 @@ class GameLoop:
                 self._log_action("SESSION",
                                  f"Session {sid_str} summary stored "
                                  f"({len(resp.content)} chars)")
-                # Generate HTML report
-                report_html = generate_session_report(
-                    self.state, self.state.session_id)
-                report_filename = f"Session_{self.state.session_id}_Report.html"
-                report_path = os.path.join(self._data_dir, report_filename)
-                with open(report_path, "w", encoding="utf-8") as f:
-                    f.write(report_html)
-                self._log_action("REPORT",
-                                 f"HTML report saved: {report_filename}")
-                # Final save with summary included
-                self._auto_save()
+                # Regenerate HTML report (now with summary) off the request path
+                self._queue_session_report(self.state.session_id)
+                # Final save with summary included happens below
 
             elif resp.type.endswith("_FORGE") or resp.type == "ZONE_EXPANSION":
                 # DG-17: Forge responses — state_changes applied above
@@ -706,7 +1096,6 @@ class GameLoop:
         # If post-creative audit found ambiguous bullets, queue for next round
         if new_reviews:
             self.creative_queue.enqueue_many(new_reviews)
-            self._write_pending_file()
             self._log_action("CREATIVE",
                              f"{len(new_reviews)} post-creative clock review(s) queued")
 
@@ -778,6 +1167,7 @@ class GameLoop:
             trigger_context=p.get("trigger_context", "")),
     }
 
+    @_mutates
     def trigger_forge(self, forge_type: str, params: dict) -> dict:
         """Manually trigger a forge from the FORGE tab UI."""
         if self.phase != GamePhase.IDLE:
@@ -798,7 +1188,6 @@ class GameLoop:
 
         self.creative_queue.clear()
         self.creative_queue.enqueue(req)
-        self._write_pending_file()
         self._set_phase(GamePhase.AWAIT_CREATIVE)
         self._log_action("FORGE", f"[{forge_type}] queued — awaiting Claude")
 
@@ -813,6 +1202,7 @@ class GameLoop:
     # SESSION LIFECYCLE (DG-19)
     # ─────────────────────────────────────────────────
 
+    @_mutates
     def start_session(self) -> dict:
         """
         SSM — Session Start Macro.
@@ -849,7 +1239,6 @@ class GameLoop:
         if forge_requests:
             self.creative_queue.clear()
             self.creative_queue.enqueue_many(forge_requests)
-            self._write_pending_file()
             self._set_phase(GamePhase.AWAIT_CREATIVE)
             self._log_action("ZONE_FORGE",
                              f"{len(forge_requests)} forge requests queued")
@@ -869,6 +1258,7 @@ class GameLoop:
             "creative_pending": self.creative_queue.pending_count(),
         }
 
+    @_mutates
     def end_session(self) -> dict:
         """
         ENDS — Session End Macro.
@@ -881,24 +1271,19 @@ class GameLoop:
 
         sid = self.state.session_id
 
-        # Save immediately (state loss prevention)
+        # Save immediately (state loss prevention) — wait for the writer
         self._auto_save()
+        self._flush_saves()
         self._log_action("SESSION", f"=== SESSION {sid} ENDING ===")
 
-        # Generate HTML report immediately (will be regenerated with
-        # summary once Claude responds)
-        report_html = generate_session_report(self.state, sid)
-        report_filename = f"Session_{sid}_Report.html"
-        report_path = os.path.join(self._data_dir, report_filename)
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(report_html)
-        self._log_action("REPORT", f"HTML report saved: {report_filename}")
+        # Generate HTML report in the background (regenerated with the
+        # summary once Claude responds); get_session_report waits for it
+        self._queue_session_report(sid)
 
         # Queue SESSION_SUMMARY creative request
         summary_req = build_session_summary(self.state)
         self.creative_queue.clear()
         self.creative_queue.enqueue(summary_req)
-        self._write_pending_file()
         self._set_phase(GamePhase.AWAIT_CREATIVE)
 
         return {
@@ -909,23 +1294,75 @@ class GameLoop:
             "pending_types": self.creative_queue.pending_types(),
         }
 
+    def _queue_session_report(self, session_id: int):
+        """Render the HTML report for session_id on the report executor.
+
+        The worker rebuilds its own GameState from a serialized snapshot
+        since self.state keeps mutating on this thread. The snapshot skips
+        _json_cache: this may run mid-method, and a cached snapshot would be
+        reused for later changes made under the same revision.
+        """
+        report_filename = f"Session_{session_id}_Report.html"
+        report_path = os.path.join(self._data_dir, report_filename)
+        self._report_cache.pop(session_id, None)
+        old = self._report_futures.pop(session_id, None)
+        if old is not None and old.done():
+            self._report_result(old)        # surface a failed earlier render
+        self._report_futures[session_id] = self._report_executor.submit(
+            self._write_session_report, state_to_json_bytes(self.state),
+            session_id, report_path)
+        self._log_action("REPORT", f"HTML report queued: {report_filename}")
+
+    @staticmethod
+    def _write_session_report(snapshot: bytes, session_id: int,
+                              report_path: str) -> str:
+        """Render and write an HTML session report. Runs on the report
+        executor; errors stay in the future (see _report_result)."""
+        report_html = generate_session_report(state_from_json(snapshot),
+                                              session_id)
+        _write_atomic(report_path, report_html.encode("utf-8"))
+        return report_html
+
+    def _report_result(self, future: Optional[Future]) -> Optional[str]:
+        """The HTML from a report future, waiting if needed. A failed render
+        is logged here, on the loop thread, and gives None."""
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            self._log_action("ERROR", f"Report generation failed: {e}")
+            return None
+
     def get_session_report(self, session_id: int) -> str:
         """Return HTML report for a session, generating if needed."""
+        cache = self._report_cache
+        cached = cache.get(session_id)
+        if cached and cached[0] == self._state_rev:
+            return cached[1]
         report_filename = f"Session_{session_id}_Report.html"
         report_path = os.path.join(self._data_dir, report_filename)
-        if os.path.exists(report_path):
+        report_html = self._report_result(self._report_futures.pop(session_id, None))
+        if report_html is not None:
+            pass
+        elif os.path.exists(report_path):
             with open(report_path, "r", encoding="utf-8") as f:
-                return f.read()
-        # Generate on demand
-        report_html = generate_session_report(self.state, session_id)
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(report_html)
+                report_html = f.read()
+        else:
+            # Generate on demand
+            report_html = generate_session_report(self.state, session_id)
+            _write_atomic(report_path, report_html.encode("utf-8"))
+        cache.pop(session_id, None)
+        cache[session_id] = (self._state_rev, report_html)
+        if len(cache) > REPORT_CACHE_MAX:
+            del cache[next(iter(cache))]        # oldest insertion
         return report_html
 
     # ─────────────────────────────────────────────────
     # COMBAT (DG-16)
     # ─────────────────────────────────────────────────
 
+    @_mutates
     def start_combat_with_npc(self, npc_name: str) -> dict:
         """Manually start combat with an NPC in the current zone."""
         if self.phase != GamePhase.IDLE:
@@ -934,14 +1371,8 @@ class GameLoop:
         if not self.state:
             return {"success": False, "error": "No state loaded"}
 
-        # Find the NPC
-        npc = self.state.npcs.get(npc_name)
-        if not npc:
-            # Try case-insensitive match
-            for name, n in self.state.npcs.items():
-                if name.lower() == npc_name.lower():
-                    npc = n
-                    break
+        # Find the NPC (exact, then case-insensitive)
+        npc = self.state.find_npc(npc_name)
         if not npc:
             return {"success": False, "error": f"NPC not found: {npc_name}"}
         if npc.zone != self.state.pc_zone:
@@ -949,7 +1380,7 @@ class GameLoop:
                     "error": f"{npc.name} is in {npc.zone}, not {self.state.pc_zone}"}
 
         # Dead NPC guard (spec bug #4)
-        if getattr(npc, "status", "") in ("dead", "destroyed"):
+        if npc.status in ("dead", "destroyed"):
             return {"success": False,
                     "error": f"{npc.name} is {npc.status} — cannot fight"}
 
@@ -986,6 +1417,7 @@ class GameLoop:
         except Exception as e:
             return {"success": False, "error": f"Failed to init combat: {e}"}
 
+    @_mutates
     def combat_action(self, action: str) -> dict:
         """
         Player chose ATTACK or FLEE for this combat round.
@@ -1017,19 +1449,10 @@ class GameLoop:
         self._log_action("COMBAT",
                          f"Round {combat.round_number}: {action_upper} — {summary}")
 
-        # Log each MECH entry from this round
-        for entry in combat.combat_log:
-            if entry.startswith("---") or entry.startswith("==="):
-                continue  # skip headers in action log
-
-        # Check if combat ended this round
+        # The round resolvers set combat.ended authoritatively
         if combat.ended:
             return self._end_combat()
 
-        # Check start-of-next-round conditions
-        if check_combat_end(combat):
-            return self._end_combat()
-
         return {
             "success": True,
             "round": combat.round_number,
@@ -1039,6 +1462,7 @@ class GameLoop:
             "ended": False,
         }
 
+    @_mutates
     def _end_combat(self) -> dict:
         """Combat has ended. Apply results, queue narration, transition."""
         combat = self.combat_state
@@ -1054,7 +1478,6 @@ class GameLoop:
         narr_req = build_narr_combat_end(self.state, combat)
         self.creative_queue.clear()
         self.creative_queue.enqueue(narr_req)
-        self._write_pending_file()
 
         combat_summary = combat.to_ui_dict()
         self.combat_state = None
@@ -1075,6 +1498,7 @@ class GameLoop:
 
     VALID_MODES = {"INTENS", "INTIM", "INVESTIG"}
 
+    @_mutates
     def set_mode(self, mode: str) -> dict:
         """Activate or deactivate a narrative mode."""
         if mode is None or mode == "" or mode.upper().startswith("EX"):
@@ -1097,6 +1521,7 @@ class GameLoop:
         self._log_action("MODE", f"Mode set: {mode_upper} (was: {old or 'none'})")
         return {"success": True, "mode": mode_upper, "previous": old}
 
+    @_mutates
     def trigger_rumor(self) -> dict:
         """Trigger a one-shot RUMOR request."""
         if self.phase != GamePhase.IDLE:
@@ -1108,7 +1533,6 @@ class GameLoop:
         req = build_rumor(self.state)
         self.creative_queue.clear()
         self.creative_queue.enqueue(req)
-        self._write_pending_file()
         self._set_phase(GamePhase.AWAIT_CREATIVE)
         self._log_action("RUMOR", f"Rumor requested for {self.state.pc_zone}")
         return {
@@ -1122,70 +1546,55 @@ class GameLoop:
     # ─────────────────────────────────────────────────
 
     def get_full_state(self) -> dict:
-        """Return everything the web UI needs to render."""
+        """Return everything the web UI needs to render.
+        The state-derived section is cached per (state revision, phase);
+        only the log/narration tail and queue counters are rebuilt per poll."""
         s = self.state
         if not s:
             return {"error": "No state loaded"}
 
-        # Active clocks
-        active_clocks = []
+        key = (self._state_rev, self.phase)
+        cached = self._full_state_cache
+        if cached is None or cached[0] != key:
+            cached = self._full_state_cache = (key, self._build_full_state(s))
+        result = dict(cached[1])
+        result["narration"] = _tail(self.narration_buffer, 20)
+        result["action_log"] = [e.ui_dict() for e in list(self.action_log)]
+        result["creative_pending"] = self.creative_queue.pending_count()
+        result["creative_call_count"] = self.creative_queue.call_count
+        return result
+
+    def _build_full_state(self, s: GameState) -> dict:
+        """State-derived part of get_full_state (everything but the tail)."""
+        # Clocks — active order comes from the urgency index
         fired_clocks = []
         halted_clocks = []
         for c in s.clocks.values():
-            cd = {
-                "name": c.name, "owner": c.owner,
-                "progress": c.progress, "max_progress": c.max_progress,
-                "status": c.status, "is_cadence": c.is_cadence,
-                "trigger_fired": c.trigger_fired,
-                "trigger_text": c.trigger_on_completion,
-            }
             if c.trigger_fired:
-                fired_clocks.append(cd)
+                fired_clocks.append(_clock_ui_dict(c))
             elif c.status == "halted":
-                halted_clocks.append(cd)
-            elif c.status != "retired":
-                active_clocks.append(cd)
-
-        # Sort active by urgency (highest fill first)
-        active_clocks.sort(
-            key=lambda c: c["progress"] / max(c["max_progress"], 1),
-            reverse=True,
-        )
-
-        # Danger clocks for header (>= 75% full)
-        danger_clocks = [
-            c for c in active_clocks
-            if c["progress"] / max(c["max_progress"], 1) >= 0.75
-        ]
-
-        # NPCs
+                halted_clocks.append(_clock_ui_dict(c))
+        urgency = self._clock_urgency_index()
+        active_clocks = [_clock_ui_dict(s.clocks[name]) for _, name in urgency]
+
+        # Danger clocks for header (>= 75% full) — a prefix of the
+        # fullest-first order, so stop at the first clock below the line
+        n_danger = 0
+        for ratio, _ in urgency:
+            if ratio < 0.75:
+                break
+            n_danger += 1
+        danger_clocks = active_clocks[:n_danger]
+
+        # NPCs — per-NPC UI dicts are cached on the NPC (NPC.ui_dict)
         companions = []
         other_npcs = []
         for npc in s.npcs.values():
-            nd = {
-                "name": npc.name, "zone": npc.zone, "status": npc.status,
-                "role": npc.role, "trait": npc.trait, "faction": npc.faction,
-                "with_pc": npc.with_pc, "is_companion": npc.is_companion,
-                "bx_hp": npc.bx_hp, "bx_hp_max": npc.bx_hp_max,
-            }
             if npc.is_companion:
-                # Full companion data for PARTY tab
-                nd.update({
-                    "class_level": npc.class_level,
-                    "bx_ac": npc.bx_ac,
-                    "bx_hd": npc.bx_hd,
-                    "bx_at": npc.bx_at,
-                    "bx_dmg": npc.bx_dmg,
-                    "bx_ml": npc.bx_ml,
-                    "appearance": npc.appearance,
-                    "objective": npc.objective,
-                    "knowledge": npc.knowledge,
-                    "next_action": npc.next_action,
-                    "history": npc.history[-5:] if npc.history else [],
-                })
                 # Companion detail (relationship, trust, etc.)
                 comp_detail = s.companions.get(npc.name)
                 if comp_detail:
+                    nd = dict(npc.ui_dict())
                     nd["trust_in_pc"] = comp_detail.trust_in_pc
                     nd["affection_levels"] = comp_detail.affection_levels
                     nd["motivation_shift"] = comp_detail.motivation_shift
@@ -1194,22 +1603,11 @@ class GameLoop:
                     nd["grievances"] = comp_detail.grievances
                     nd["agency_notes"] = comp_detail.agency_notes
                     nd["future_flashpoints"] = comp_detail.future_flashpoints
-                companions.append(nd)
+                    companions.append(nd)
+                else:
+                    companions.append(npc.ui_dict())
             else:
-                # DG-28: Include detail fields for expandable NPC rows
-                nd.update({
-                    "appearance": npc.appearance,
-                    "objective": npc.objective,
-                    "class_level": npc.class_level,
-                    "bx_ac": npc.bx_ac,
-                    "bx_hd": npc.bx_hd,
-                    "bx_at": npc.bx_at,
-                    "bx_dmg": npc.bx_dmg,
-                    "bx_ml": npc.bx_ml,
-                    "knowledge": npc.knowledge,
-                    "next_action": npc.next_action,
-                })
-                other_npcs.append(nd)
+                other_npcs.append(npc.ui_dict())
 
         # Factions
         factions = []
@@ -1271,7 +1669,7 @@ class GameLoop:
                 "campaign_intensity": s.campaign_intensity,
                 "seasonal_pressure": s.seasonal_pressure,
             },
-            "crossing_points": get_crossing_points(s) if self.phase == GamePhase.IDLE else [],
+            "crossing_points": self._crossing_points() if self.phase == GamePhase.IDLE else [],
             "danger_clocks": danger_clocks,
             "active_clocks": active_clocks,
             "fired_clocks": fired_clocks,
@@ -1282,17 +1680,36 @@ class GameLoop:
             "engines": engines,
             "pc": pc,
             "open_threads": open_threads,
-            "narration": self.narration_buffer[-20:],
-            "action_log": self.action_log[-100:],
             "zones": sorted(list(s.zones.keys())) if s.zones else [],
-            "creative_pending": self.creative_queue.pending_count(),
-            "creative_call_count": self.creative_queue.call_count,
             "combat": (self.combat_state.to_ui_dict()
                        if self.combat_state and self.phase == GamePhase.IN_COMBAT
                        else None),
             "active_mode": self.active_mode,  # DG-22
         }
 
+    def _clock_urgency_index(self) -> list[tuple[float, str]]:
+        """(fill ratio, name) for every active clock, fullest first.
+        Clocks are advanced all over engine.py / creative_bridge, so the
+        index is rebuilt once per state revision rather than per poll."""
+        if self._clock_fill_rev != self._state_rev or self._clock_fill_index is None:
+            index = [(c.progress / max(c.max_progress, 1), c.name)
+                     for c in self.state.clocks.values()
+                     if not c.trigger_fired
+                     and c.status not in ("halted", "retired")]
+            index.sort(key=itemgetter(0), reverse=True)
+            self._clock_fill_index = index
+            self._clock_fill_rev = self._state_rev
+        return self._clock_fill_index
+
+    def iter_active_by_urgency(self, min_fill: float = 0.0):
+        """Yield (fill ratio, Clock) for active clocks, fullest first,
+        stopping at the first clock below min_fill."""
+        clocks = self.state.clocks
+        for ratio, name in self._clock_urgency_index():
+            if ratio < min_fill:
+                break
+            yield ratio, clocks[name]
+
     def get_creative_pending(self) -> dict:
         """Return pending creative requests for Claude (MCP pulls this)."""
         if self.creative_queue.is_empty():
@@ -1313,11 +1730,11 @@ class GameLoop:
         if not filename.endswith(".json"):
             filename += ".json"
         filepath = os.path.join(self._data_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(state_to_json(self.state))
+        _write_atomic(filepath, self._state_bytes())
         self._log_action("SAVE", f"Saved: {filename}")
         return filename
 
+    @_mutates
     def load_game(self, filename: str) -> dict:
         """Load state from a save file."""
         filepath = os.path.join(self._data_dir, filename)
@@ -1328,14 +1745,14 @@ class GameLoop:
                 return {"success": False, "error": f"File not found: {filename}"}
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
+            with open(filepath, "rb") as f:
                 self.state = state_from_json(f.read())
             self._backfill_crossing_points(self.state)
             self._backfill_companion_stats(self.state)
             self._backfill_pc_stats(self.state)
             self._backfill_encounter_lists(self.state)
             self.creative_queue.clear()
-            self.narration_buffer = []
+            self.narration_buffer.clear()
             self._set_phase(GamePhase.IDLE)
             self._log_action("SESSION", f"Loaded: {filename}")
             return {
@@ -1352,40 +1769,108 @@ class GameLoop:
         """List available save files."""
         if not os.path.isdir(self._data_dir):
             return []
-        saves = sorted(
-            glob.glob(os.path.join(self._data_dir, "save_*.json")) +
-            glob.glob(os.path.join(self._data_dir, "Session *.json")),
-            key=os.path.getmtime, reverse=True,
-        )
         result = []
-        for s in saves:
+        for e in _scan_saves(self._data_dir):
+            st = e.stat()
             result.append({
-                "filename": os.path.basename(s),
-                "size": os.path.getsize(s),
+                "filename": e.name,
+                "size": st.st_size,
                 "modified": datetime.fromtimestamp(
-                    os.path.getmtime(s)
+                    st.st_mtime
                 ).strftime("%Y-%m-%d %H:%M"),
             })
         return result
 
     def _auto_save(self):
-        """Auto-save after state-changing operations."""
+        """Auto-save after state-changing operations. Serializes here, on the
+        loop thread, where the state is consistent; the background writer
+        only writes the bytes. A save still waiting to be written is replaced.
+        No-op when the state revision has not moved since the last save."""
+        if self._state_rev == self._last_saved_rev:
+            return
+        self._last_saved_rev = self._state_rev
         try:
-            os.makedirs(self._data_dir, exist_ok=True)
-            filename = self._canonical_save_name()
-            filepath = os.path.join(self._data_dir, filename)
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(state_to_json(self.state))
+            filepath = os.path.join(self._data_dir, self._canonical_save_name())
+            self._pending_save.append((filepath, self._state_bytes()))
         except Exception:
+            return
+        self._wake_writer()
+
+    def _wake_writer(self):
+        """Queue a pass of the background writer unless one is already queued."""
+        try:
+            self._save_q.put_nowait(None)
+        except queue.Full:
             pass
 
+    def _flush_saves(self):
+        """Block until every queued auto-save has hit disk."""
+        self._save_q.join()
+
+    def _save_worker(self):
+        """Background writer loop. Writes the pending save if there is one,
+        then appends pending log lines."""
+        while True:
+            self._save_q.get()
+            try:
+                try:
+                    filepath, data = self._pending_save.popleft()
+                except IndexError:
+                    pass
+                else:
+                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                    _write_atomic(filepath, data)
+                self._flush_log_batch()
+            except Exception:
+                pass
+            finally:
+                self._save_q.task_done()
+
+    def _flush_log_batch(self):
+        """Append pending action log entries to the LOG_RING_FILE ring as
+        JSON lines, one msync per batch. Drains with popleft, so entries the
+        loop thread appends meanwhile stay queued for the next pass."""
+        pending = self._log_batch
+        batch = []
+        try:
+            while True:
+                batch.append(pending.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return
+        data_dir = getattr(self, "_data_dir", None)
+        if not data_dir:
+            return
+        ring = self._log_ring
+        if ring is None:
+            os.makedirs(data_dir, exist_ok=True)
+            ring = self._log_ring = _LogRing(os.path.join(data_dir, LOG_RING_FILE))
+        if _orjson:
+            records = [_orjson.dumps(e.ui_dict()) + b"\n" for e in batch]
+        else:
+            records = [(json.dumps(e.ui_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+                       for e in batch]
+        ring.append_many(records)
+
+    def _state_bytes(self) -> bytes:
+        """state_to_json_bytes, reused while the state revision is unchanged.
+        Loop thread only."""
+        rev = self._state_rev
+        cached = self._json_cache
+        if cached and cached[0] == rev:
+            return cached[1]
+        data = state_to_json_bytes(self.state)
+        self._json_cache = (rev, data)
+        return data
+
     def _canonical_save_name(self) -> str:
         s = self.state
         sid = str(s.session_id).zfill(2)
         date_str = s.in_game_date or "unknown"
         zone_str = s.pc_zone or "unknown"
-        safe_date = date_str.replace("/", "-").replace("\\", "-").replace(":", "-")
-        safe_zone = zone_str.replace("/", "-").replace("\\", "-").replace(":", "-")
+        safe_date = date_str.translate(self._CANON_SANITIZE)
+        safe_zone = zone_str.translate(self._CANON_SANITIZE)
         return f"Session {sid} - {safe_date} - {safe_zone}.json"
 
     # ─────────────────────────────────────────────────
@@ -1397,198 +1882,174 @@ class GameLoop:
         If already a CreativeRequest (from forge builders), return as-is."""
         if isinstance(raw_req, CreativeRequest):
             return raw_req
-        req_type = raw_req.get("type", "")
-
-        if req_type == "CLOCK_AUDIT_REVIEW":
-            return build_clock_audit(
-                clock_name=raw_req.get("clock", ""),
-                progress=raw_req.get("progress", ""),
-                ambiguous_bullets=raw_req.get("ambiguous_bullets", []),
-                daily_facts=raw_req.get("daily_facts", []),
-            )
+        convert = self._REQ_DISPATCH.get(raw_req.get("type", ""))
+        return convert(self, raw_req) if convert else None
+
+    def _req_clock_audit(self, raw_req) -> CreativeRequest:
+        return build_clock_audit(
+            clock_name=raw_req.get("clock", ""),
+            progress=raw_req.get("progress", ""),
+            ambiguous_bullets=raw_req.get("ambiguous_bullets", []),
+            daily_facts=raw_req.get("daily_facts", []),
+        )
 
-        elif req_type == "NPAG":
-            return build_npag(self.state, raw_req.get("npc_count", 0))
+    def _req_npag(self, raw_req) -> CreativeRequest:
+        return build_npag(self.state, raw_req.get("npc_count", 0))
 
-        elif req_type == "NARR_ENCOUNTER":
-            bx_detail = raw_req.get("bx_plug_detail")
-            encounter_data = {
-                "description": raw_req.get("context", ""),
-                "has_bx_plug": raw_req.get("bx_plug", False),
-                "bx_stat_block": bx_detail if bx_detail else "",
-                "ua_cue": raw_req.get("ua_cue", False),
+    def _req_narr_encounter(self, raw_req) -> CreativeRequest:
+        bx_detail = raw_req.get("bx_plug_detail")
+        encounter_data = {
+            "description": raw_req.get("context", ""),
+            "has_bx_plug": raw_req.get("bx_plug", False),
+            "bx_stat_block": bx_detail if bx_detail else "",
+            "ua_cue": raw_req.get("ua_cue", False),
+        }
+        # DG-16: Stash bx_plug detail for combat after narration
+        if bx_detail and (bx_detail.get("type") == "combat"
+                          or bx_detail.get("hostile_action")):
+            self._pending_combat_data = {
+                "bx_plug": bx_detail,
+                "encounter_prompt": raw_req.get("context", ""),
             }
-            # DG-16: Stash bx_plug detail for combat after narration
-            if bx_detail and (bx_detail.get("type") == "combat"
-                              or bx_detail.get("hostile_action")):
-                self._pending_combat_data = {
-                    "bx_plug": bx_detail,
-                    "encounter_prompt": raw_req.get("context", ""),
-                }
-            return build_narr_encounter(self.state, encounter_data, active_mode=self.active_mode)
-
-        elif req_type == "CAN-FORGE-AUTO":
-            # VP roll=12 — route through UA_FORGE (DG-17)
-            return build_ua_forge(
-                self.state,
-                zone=raw_req.get("zone", self.state.pc_zone),
-                trigger_context="VP roll 12 — automatic UA threat",
-            )
+        return build_narr_encounter(self.state, encounter_data, active_mode=self.active_mode)
 
-        # DG-17 Forge request types
-        elif req_type == "NPC_FORGE":
-            return build_npc_forge(
-                self.state,
-                zone=raw_req.get("zone", self.state.pc_zone),
-                role_hint=raw_req.get("role_hint", ""),
-                faction_hint=raw_req.get("faction_hint", ""),
-            )
+    def _req_can_forge_auto(self, raw_req) -> CreativeRequest:
+        # VP roll=12 — route through UA_FORGE (DG-17)
+        return build_ua_forge(
+            self.state,
+            zone=raw_req.get("zone", self.state.pc_zone),
+            trigger_context="VP roll 12 — automatic UA threat",
+        )
 
-        elif req_type == "EL_FORGE":
-            return build_el_forge(
-                self.state,
-                zone=raw_req.get("zone", self.state.pc_zone),
-            )
+    # DG-17 Forge request types
 
-        elif req_type == "FAC_FORGE":
-            return build_fac_forge(
-                self.state,
-                faction_name=raw_req.get("faction_name", ""),
-                zone_hint=raw_req.get("zone_hint", ""),
-            )
+    def _req_npc_forge(self, raw_req) -> CreativeRequest:
+        return build_npc_forge(
+            self.state,
+            zone=raw_req.get("zone", self.state.pc_zone),
+            role_hint=raw_req.get("role_hint", ""),
+            faction_hint=raw_req.get("faction_hint", ""),
+        )
 
-        elif req_type == "CAN_FORGE":
-            return build_can_forge(
-                self.state,
-                zone=raw_req.get("zone", self.state.pc_zone),
-                trigger=raw_req.get("trigger", "manual"),
-            )
+    def _req_el_forge(self, raw_req) -> CreativeRequest:
+        return build_el_forge(
+            self.state,
+            zone=raw_req.get("zone", self.state.pc_zone),
+        )
 
-        elif req_type == "CL_FORGE":
-            return build_cl_forge(
-                self.state,
-                owner=raw_req.get("owner", ""),
-                trigger_context=raw_req.get("trigger_context", ""),
-            )
+    def _req_fac_forge(self, raw_req) -> CreativeRequest:
+        return build_fac_forge(
+            self.state,
+            faction_name=raw_req.get("faction_name", ""),
+            zone_hint=raw_req.get("zone_hint", ""),
+        )
 
-        elif req_type == "PE_FORGE":
-            return build_pe_forge(
-                self.state,
-                engine_name=raw_req.get("engine_name", ""),
-                zone_scope=raw_req.get("zone_scope", ""),
-                trigger_event=raw_req.get("trigger_event", ""),
-            )
+    def _req_can_forge(self, raw_req) -> CreativeRequest:
+        return build_can_forge(
+            self.state,
+            zone=raw_req.get("zone", self.state.pc_zone),
+            trigger=raw_req.get("trigger", "manual"),
+        )
 
-        elif req_type == "UA_FORGE":
-            return build_ua_forge(
-                self.state,
-                zone=raw_req.get("zone", self.state.pc_zone),
-                trigger_context=raw_req.get("trigger_context", ""),
-            )
+    def _req_cl_forge(self, raw_req) -> CreativeRequest:
+        return build_cl_forge(
+            self.state,
+            owner=raw_req.get("owner", ""),
+            trigger_context=raw_req.get("trigger_context", ""),
+        )
+
+    def _req_pe_forge(self, raw_req) -> CreativeRequest:
+        return build_pe_forge(
+            self.state,
+            engine_name=raw_req.get("engine_name", ""),
+            zone_scope=raw_req.get("zone_scope", ""),
+            trigger_event=raw_req.get("trigger_event", ""),
+        )
+
+    def _req_ua_forge(self, raw_req) -> CreativeRequest:
+        return build_ua_forge(
+            self.state,
+            zone=raw_req.get("zone", self.state.pc_zone),
+            trigger_context=raw_req.get("trigger_context", ""),
+        )
+
+    # Engine llm_request type -> converter (unbound; called as fn(self, raw))
+    _REQ_DISPATCH = {
+        "CLOCK_AUDIT_REVIEW": _req_clock_audit,
+        "NPAG": _req_npag,
+        "NARR_ENCOUNTER": _req_narr_encounter,
+        "CAN-FORGE-AUTO": _req_can_forge_auto,
+        "NPC_FORGE": _req_npc_forge,
+        "EL_FORGE": _req_el_forge,
+        "FAC_FORGE": _req_fac_forge,
+        "CAN_FORGE": _req_can_forge,
+        "CL_FORGE": _req_cl_forge,
+        "PE_FORGE": _req_pe_forge,
+        "UA_FORGE": _req_ua_forge,
+    }
 
-        return None
+    def _crossing_points(self) -> list[dict]:
+        """get_crossing_points for the current zone, cached until the PC
+        moves or the zone graph changes (state._zone_version)."""
+        st = self.state
+        key = (st.pc_zone, st._zone_version)
+        if key != self._cp_cache_key:
+            self._cp_cache = get_crossing_points(st)
+            self._cp_cache_key = key
+        return self._cp_cache
 
     def _log_tp_day(self, day_log: dict):
         """Log T&P day results to the action log."""
-        date = day_log.get("date", "?")
+        entries: list[tuple[str, str | tuple]] = []
+        add = entries.append
 
         for step in day_log.get("steps", []):
             sn = step["step"]
-            r = step.get("result", step.get("results", {}))
-
-            if sn == "date_advance":
-                if r.get("season_changed"):
-                    self._log_action("DATE", f"{r['new_date']} — SEASON: {r['new_season']}")
-                else:
-                    self._log_action("DATE", r.get("new_date", "?"))
-
-            elif sn.startswith("engine:"):
-                en = sn.split(":", 1)[1]
-                if r.get("skipped") or r.get("status") == "inert":
+            handler = _TP_LOG_HANDLERS.get(sn)
+            if handler is None:
+                if not sn.startswith("engine:"):
                     continue
-                if "roll" in r:
-                    self._log_action("ENGINE",
-                                     f"{en}: 2d6={r['roll']['total']} -> {r.get('outcome_band', '')}")
-                    for ce in r.get("clock_effects_applied", []):
-                        if not ce.get("skipped") and "error" not in ce:
-                            self._log_action("CLOCK_ADVANCE",
-                                             f"{ce['clock']}: {ce.get('old', '?')}->{ce.get('new', '?')}")
-
-            elif sn == "cadence_clocks":
-                for cr in step.get("results", []):
-                    if "error" not in cr:
-                        if cr.get("action") == "cadence_eligible_for_audit":
-                            self._log_action("CADENCE",
-                                             f"{cr['clock']}: audit-eligible (no cadence_bullet)")
-                        else:
-                            self._log_action("CADENCE",
-                                             f"{cr['clock']}: {cr['old']}->{cr['new']}/{cr['max']}")
-                            if cr.get("trigger_fired"):
-                                self._log_action("TRIGGER", f"FIRED: {cr.get('trigger_text', '')}")
-
-            elif sn == "clock_audit":
-                for a in r.get("auto_advanced", []):
-                    ar = a["advance_result"]
-                    self._log_action("CLOCK_AUDIT",
-                                     f"{a['clock']}: {ar['old']}->{ar['new']}/{ar.get('max', '?')}")
-                for rv in r.get("needs_llm_review", []):
-                    self._log_action("CLOCK_AUDIT",
-                                     f"{rv['clock']}: needs Claude review "
-                                     f"({len(rv['ambiguous_bullets'])} bullets)")
-
-            elif sn == "clock_interactions":
-                for flag in r.get("flags", []):
-                    self._log_action("TRIGGER",
-                                     f"INTERACTION {flag['rule']}: {flag['text'][:80]}")
-                for adv in r.get("advances", []):
-                    ar = adv["result"]
-                    self._log_action("CLOCK_ADVANCE",
-                                     f"INTERACTION {adv['rule']}: "
-                                     f"{ar['clock']}: {ar['old']}->{ar['new']}")
-                for spawn in r.get("spawns", []):
-                    self._log_action("TRIGGER",
-                                     f"INTERACTION {spawn['rule']}: SPAWNED {spawn['clock']}")
-
-            elif sn == "halt_evaluation":
-                for h in (r if isinstance(r, list) else []):
-                    self._log_action("CLOCK_AUDIT",
-                                     f"HALTED: {h['clock']} \u2014 {h['condition'][:60]}")
-
-            elif sn == "encounter_gate":
-                rv = r["roll"]["total"]
-                intensity = r.get("intensity", "?")
-                if r["passed"]:
-                    enc = r.get("encounter", {})
-                    self._log_action("ENCOUNTER",
-                                     f"PASS (d6={rv}, {intensity}) -> "
-                                     f"{enc.get('prompt', 'no table')[:60]}")
-                    # Log reaction roll if present (BX-PLUG §2.1)
-                    reaction = enc.get("reaction")
-                    if reaction:
-                        self._log_action("MECH",
-                                         f"Reaction: 2d6={reaction['total']} -> "
-                                         f"{reaction['band']}")
-                else:
-                    self._log_action("ENCOUNTER", f"fail (d6={rv}, {intensity})")
-
-            elif sn == "npag_gate":
-                rv = r["roll"]["total"]
-                intensity = r.get("intensity", "?")
-                if r["passed"]:
-                    self._log_action("NPAG",
-                                     f"PASS (d6={rv}, {intensity}) -> "
-                                     f"{r['npc_count']['count']} NPCs")
-                else:
-                    self._log_action("NPAG", f"fail (d6={rv}, {intensity})")
-
-    def _log_action(self, action_type: str, detail: str):
-        """Add an entry to the action log."""
-        entry = {
-            "type": action_type,
-            "detail": detail,
-            "timestamp": datetime.now().isoformat(),
-            "date": self.state.in_game_date if self.state else "",
-        }
+                handler = _tp_log_engine
+            handler(sn, step, step.get("result", step.get("results", {})), add)
+
+        self._log_many(entries)
+
+    def _log_action(self, action_type: str, detail: str | tuple):
+        """Add an entry to the action log. detail may be a lazy
+        (fmt, *args) tuple, see LogEntry.
+
+        action_type stays a plain positional argument: partialmethod
+        aliases (_log_combat = partialmethod(_log_action, "COMBAT"))
+        build a new partial on every attribute lookup and measure ~30x
+        slower per call than passing the string. Hot per-step types
+        (ENCOUNTER, NPAG, ...) go through _log_many instead."""
+        date = self.state.in_game_date if self.state else ""
+        entry = LogEntry(action_type, detail, date, self._tick_ts or time.time())
         self.action_log.append(entry)
-        if self._on_log_entry:
-            self._on_log_entry(entry)
+        batch = self._log_batch
+        batch.append(entry)
+        if len(batch) >= LOG_FLUSH_EVERY:
+            self._wake_writer()
+        q = self.log_queue
+        if q is not None:
+            q.put(entry)
+
+    def _log_many(self, entries: list[tuple[str, str | tuple]]):
+        """Add several (action_type, detail) entries in one go. Date and
+        timestamp are taken once for the whole batch. detail may be a lazy
+        (fmt, *args) tuple, see LogEntry."""
+        if not entries:
+            return
+        date = self.state.in_game_date if self.state else ""
+        ts = self._tick_ts or time.time()
+        logged = [LogEntry(action_type, detail, date, ts)
+                  for action_type, detail in entries]
+        self.action_log.extend(logged)
+        batch = self._log_batch
+        batch.extend(logged)
+        if len(batch) >= LOG_FLUSH_EVERY:
+            self._wake_writer()
+        q = self.log_queue
+        if q is not None:
+            for entry in logged:
+                q.put(entry)
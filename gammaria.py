@@ -7,56 +7,109 @@ Run:  python gammaria.py
 Open: http://localhost:8000
 """
 
+import atexit
+import logging
 import os
+import queue
+import socket
 import sys
 import threading
 import time
-import webbrowser
-import uvicorn
+from logging.handlers import QueueHandler, QueueListener
+from importlib.util import find_spec
 
-# When running under pythonw.exe, stdout/stderr are None — redirect to devnull
+# uvicorn, webbrowser and web.routes (starlette, pydantic, the engine) are
+# imported where they are used, so importing this module stays cheap.
+
+
+class _Null:
+    """Discarding stream — no file descriptor, no encoding work."""
+    def write(self, *args, **kwargs):
+        return 0
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+# When running under pythonw.exe, stdout/stderr are None — discard output
 if sys.stdout is None:
-    sys.stdout = open(os.devnull, 'w')
+    sys.stdout = _Null()
 if sys.stderr is None:
-    sys.stderr = open(os.devnull, 'w')
+    sys.stderr = _Null()
 
 # Ensure engine directory is on the path
 ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, ENGINE_DIR)
 
-from web.routes import app, init_game
-
 PORT = 8000
 DATA_DIR = os.path.join(ENGINE_DIR, "data")
 
 
 def _open_browser():
-    """Open the browser after the server has had time to start."""
-    time.sleep(2.5)
+    """Open the browser as soon as the server accepts connections
+    (probing with backoff; opens anyway once the probes run out)."""
+    for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6):
+        try:
+            socket.create_connection(("127.0.0.1", PORT), timeout=delay).close()
+            break
+        except OSError:
+            time.sleep(delay)
+    import webbrowser
     webbrowser.open(f"http://localhost:{PORT}")
 
 
+def _queue_logging():
+    """Send log records (uvicorn's included) through a queue: the server
+    thread only enqueues; a listener thread formats and writes to stderr."""
+    q = queue.SimpleQueue()
+    out = logging.StreamHandler(sys.stderr)
+    out.setFormatter(logging.Formatter("%(levelname)s:  %(message)s"))
+    listener = QueueListener(q, out)
+    listener.start()
+    atexit.register(listener.stop)
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(q)]
+    root.setLevel(logging.WARNING)
+
+
 def main():
+    import uvicorn
+    from web.routes import app, init_game
+
     # Initialize game state
     init_game(DATA_DIR)
 
-    print("=" * 50)
-    print("  GAMMARIA — MACROS Engine v4.1")
-    print("=" * 50)
-    print(f"  Server: http://localhost:{PORT}")
-    print(f"  Data:   {DATA_DIR}")
-    print()
-    print("  Browser will open automatically.")
-    print("  Connect Claude Desktop MCP for creative content.")
-    print("  Press Ctrl+C to stop.")
-    print("=" * 50)
-    print()
+    if not isinstance(sys.stdout, _Null):
+        sys.stdout.write("\n".join([
+            "=" * 50,
+            "  GAMMARIA — MACROS Engine v4.1",
+            "=" * 50,
+            f"  Server: http://localhost:{PORT}",
+            f"  Data:   {DATA_DIR}",
+            "",
+            "  Browser will open automatically.",
+            "  Connect Claude Desktop MCP for creative content.",
+            "  Press Ctrl+C to stop.",
+            "=" * 50,
+            "",
+        ]) + "\n")
+        sys.stdout.flush()
 
     # Open browser on a background thread so server starts first
     threading.Thread(target=_open_browser, daemon=True).start()
 
-    # Start server (blocking)
-    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning")
+    # Start server (blocking). uvloop + httptools when installed (uvloop
+    # has no Windows build); no per-request access log. log_config=None
+    # keeps uvicorn on the queued root handler.
+    _queue_logging()
+    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning",
+                log_config=None,
+                loop="uvloop" if find_spec("uvloop") else "asyncio",
+                http="httptools" if find_spec("httptools") else "h11",
+                access_log=False, server_header=False, date_header=False)
 
 
 if __name__ == "__main__":
@@ -11,11 +11,16 @@ v2.0 changes:
   - Color-coded by category throughout
 """
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
-import json, sys, os, shutil
+from tkinter import ttk, scrolledtext, messagebox, filedialog, font as tkfont
+import json, sys, os, shutil, time, itertools, threading, queue
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_HERE, "data")
+sys.path.insert(0, _HERE)
 from campaign_state import load_gammaria_state
 from engine import run_day
 from models import GameState, Clock, state_to_json, state_from_json
@@ -25,36 +30,136 @@ from claude_integration import (
     launch_claude_desktop, generate_mcp_config, write_state_context,
     build_clipboard_prompt, parse_pasted_response,
 )
+try:
+    from watchdog.observers import Observer       # optional: inotify/FSEvents
+    from watchdog.observers.polling import PollingObserver
+except ImportError:
+    Observer = None
+
+
+_iso_last = (None, "")
+
+
+def _iso_now():
+    """Current local time as ISO 8601 at 1 s resolution, formatted at most
+    once per second."""
+    global _iso_last
+    sec = int(time.time())
+    if _iso_last[0] != sec:
+        _iso_last = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _iso_last[1]
 
 
 # ── Shared pending file (GUI → MCP server) ──
-def _write_pending_to_disk(requests, state, day_logs):
-    """Write pending creative requests to shared file for MCP server."""
-    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-    os.makedirs(data_dir, exist_ok=True)
-    payload = {
-        "requests": requests,
+def _without_llm_requests(day_logs):
+    """Shallow copies of day_logs minus the bulky llm_requests key."""
+    out = []
+    for dl in day_logs:
+        d = dl.copy(); d.pop("llm_requests", None)
+        out.append(d)
+    return out
+
+
+def _pending_payload(requests, state, day_logs):
+    """Pending-file payload, built on the Tk thread from live state."""
+    return {
+        "requests": list(requests),
         "state_summary": {
             "session_id": state.session_id,
             "date": state.in_game_date,
             "zone": state.pc_zone,
             "season": state.season,
         },
-        "day_logs": [{k: v for k, v in dl.items() if k != "llm_requests"} for dl in day_logs],
-        "timestamp": datetime.now().isoformat(),
+        "day_logs": _without_llm_requests(day_logs),
+        "timestamp": _iso_now(),
     }
-    path = os.path.join(data_dir, "pending_creative.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+
+
+def _write_pending_to_disk(payload):
+    """Write pending creative requests to shared file for MCP server."""
+    os.makedirs(_DATA_DIR, exist_ok=True)
+    path = os.path.join(_DATA_DIR, "pending_creative.json")
+    # Compact JSON to a sibling temp file, then one rename: the MCP
+    # server never sees a half-written file.
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+
+
+def _write_save(path, text):
+    """Write a save file through a sibling temp file and one rename, so the
+    watcher and the MCP server never read it half-written. Returns the
+    new mtime_ns."""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", buffering=1 << 20) as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp): os.remove(tmp)
+        raise
+    return os.stat(path).st_mtime_ns
 
 
 def _clear_pending_file():
     """Remove the shared pending file."""
-    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "pending_creative.json")
+    path = os.path.join(_DATA_DIR, "pending_creative.json")
     if os.path.exists(path):
         os.remove(path)
 
 
+@lru_cache(maxsize=1)
+def _mcp_config():
+    """(instructions, config_json) for the MCP dialog; depends only on
+    install paths, so it is built once per run."""
+    return generate_mcp_config()
+
+
+def _is_save_name(name):
+    return name.endswith(".json") and name.startswith(("save_", "Session"))
+
+
+def _iter_saves():
+    """DirEntry for each save in data/; entry.stat() is cached per entry."""
+    with os.scandir(_DATA_DIR) as it:
+        for e in it:
+            if _is_save_name(e.name):
+                yield e
+
+
+def _save_mtime(e):
+    return e.stat(follow_symlinks=False).st_mtime_ns
+
+
+class _SaveEvents:
+    """watchdog handler: hands save-file writes in data/ to the Tk thread.
+    Observers only call dispatch(), so no FileSystemEventHandler base."""
+
+    def __init__(self, gui):
+        self.gui = gui
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+            return
+        # Atomic writers (tmp + os.replace) show up as a move onto the save
+        path = getattr(event, "dest_path", "") or event.src_path
+        if _is_save_name(os.path.basename(path)):
+            self.gui._call_on_tk(self.gui._schedule_reload, path)
+
+
+RELOAD_DEBOUNCE_MS = 250     # one reload per burst of save writes
+TK_CALL_POLL_MS = 20         # how often the Tk thread runs calls queued by other threads
+LOG_MAX_LINES = 5000         # action log keeps the newest lines only
+LOG_TRIM_EVERY = 100         # single-line inserts between trim checks
+PROMPT_PREVIEW_CHARS = 4096  # Ask Claude dialog shows this much until scrolled
+ROW_H = 20                   # fixed row height of the virtualized lists
+CLOCK_BAR_X, CLOCK_BAR_W, CLOCK_BAR_H = 330, 200, 14
+
 COLORS = {
     "bg_dark": "#1a1a2e", "bg_medium": "#16213e", "bg_light": "#0f3460",
     "bg_entry": "#2a2a4e", "text": "#e0e0e0", "text_dim": "#8888aa",
@@ -103,90 +208,430 @@ EVENT_ICON_MAP = {
     "NPC_UPDATE": "\U0001f464", "FAC_UPDATE": "\U0001f3db\ufe0f", "REL_UPDATE": "\U0001f495",
 }
 
+# Row colours by model field value; anything unlisted gets the caller's default
+DISPOSITION_COLORS = {"friendly": COLORS["green"], "neutral": COLORS["yellow"],
+                      "hostile": COLORS["red"], "unknown": COLORS["text_dim"]}
+REL_COLORS = {"dislike": COLORS["red"], "hatred": COLORS["red"],
+              "love": COLORS["green"], "friends": COLORS["green"]}
+CERTAINTY_COLORS = {"confirmed": COLORS["green"], "inferred": COLORS["yellow"]}
+VISIBILITY_ICONS = {"secret": "\U0001f512", "restricted": "\U0001f50d"}
+
+# Named Tk fonts, created once in MacrosGUI.__init__: widgets and canvas
+# items refer to them by name instead of passing a font tuple per call.
+F8, F9, F9B, F9I, F10, F10B, F11B, F14B = (
+    "MacrosF8", "MacrosF9", "MacrosF9B", "MacrosF9I", "MacrosF10", "MacrosF10B", "MacrosF11B", "MacrosF14B")
+FONT_SPECS = {
+    F8: (8, "normal", "roman"), F9: (9, "normal", "roman"), F9B: (9, "bold", "roman"),
+    F9I: (9, "normal", "italic"), F10: (10, "normal", "roman"), F10B: (10, "bold", "roman"),
+    F11B: (11, "bold", "roman"), F14B: (14, "bold", "roman"),
+}
+
+# Action-log Text tags: (tag, foreground, font or "")
+LOG_TAG_STYLES = (
+    ("header", COLORS["gold"], F10B),
+    ("engine", COLORS["blue"], ""),
+    ("clock_advance", COLORS["green"], ""),
+    ("trigger", COLORS["red"], F9B),
+    ("encounter", COLORS["orange"], ""),
+    ("npag", COLORS["purple"], ""),
+    ("dice", COLORS["yellow"], ""),
+    ("dim", COLORS["text_dim"], ""),
+    ("llm", COLORS["accent2"], F9I),
+    ("claude", "#cc88ff", F9B),
+    ("forge", COLORS["cyan"], ""),
+)
+
+# Fixed action-log rules, built once rather than per logged day
+DAY_RULE = "\u2550" * 35
+BOX_TOP, BOX_BOTTOM = f"\u2554{'=' * 37}\u2557", f"\u255a{'=' * 37}\u255d"
+
+# (tag, icon) per event type: one lookup per replayed log entry
+EVENT_META_DEFAULT = ("dim", "\u25aa")
+EVENT_META = {k: (EVENT_TAG_MAP.get(k, "dim"), EVENT_ICON_MAP.get(k, "\u25aa"))
+              for k in EVENT_TAG_MAP.keys() | EVENT_ICON_MAP.keys()}
+
+
+# ── Adjudication-log replay formatters: entry -> [(line, tag), ...] ──
+
+def _fmt_default(entry, etype, tag, icon):
+    detail = entry.get("detail", "")
+    return [(f"  {icon} [{etype}] {detail}" if detail else f"  {icon} [{etype}]", tag)]
+
+
+def _fmt_clock_advance(entry, etype, tag, icon):
+    if "clock" not in entry: return _fmt_default(entry, etype, tag, icon)
+    out = [(f"  {icon} {entry['clock']}: {entry.get('old','?')}\u2192{entry.get('new','?')}", tag)]
+    if entry.get("trigger_fired"):
+        out.append((f"     \U0001f525 TRG: {entry.get('trigger_text','')}", "trigger"))
+    return out
+
+
+def _fmt_dice(entry, etype, tag, icon):
+    if "expression" not in entry: return _fmt_default(entry, etype, tag, icon)
+    return [(f"  {icon} {entry['expression']} = {entry.get('dice',[])} = {entry.get('total','?')}", tag)]
+
+
+def _fmt_zone_change(entry, etype, tag, icon):
+    if "old_zone" not in entry: return _fmt_default(entry, etype, tag, icon)
+    return [(f"  {icon} Zone: {entry['old_zone']} \u2192 {entry['new_zone']}", tag)]
+
+
+_REPLAY_DISPATCH = {
+    "CLOCK_ADVANCE": _fmt_clock_advance,
+    "DICE": _fmt_dice,
+    "ZONE_CHANGE": _fmt_zone_change,
+}
+
+
+@lru_cache(maxsize=4096)
+def _clip(text, n):
+    """text cut to n chars with an ellipsis; cached, since redraws and
+    replays clip the same names and notes over and over."""
+    return text if len(text) <= n else text[:n - 1] + "\u2026"
+
+
+# ── T&P day-log step formatters: add(text, tag) per action-log line ──
+
+def _day_date_advance(add, step, r):
+    if r.get("season_changed"): add(f"  \U0001f4c5 {r['new_date']} \u2014 SEASON: {r['new_season']}", "engine")
+    else: add(f"  \U0001f4c5 {r['new_date']}", "dim")
+
+
+def _day_engine(add, step, r):
+    en = step["step"][7:]
+    if r.get("skipped"): add(f"  \u2699\ufe0f  {en}: SKIP", "dim")
+    elif r.get("status") == "inert": add(f"  \u2699\ufe0f  {en}: INERT", "dim")
+    elif "roll" in r:
+        add(f"  \u2699\ufe0f  {en}: 2d6={r['roll']['total']} \u2192 {r.get('outcome_band','')}", "engine")
+        for ce in r.get("clock_effects_applied", []):
+            if "error" in ce: add(f"     \u274c {ce.get('clock','?')}: {ce['error']}", "trigger")
+            elif not ce.get("skipped"): add(f"     \u2192 {ce['clock']}: {ce.get('old','?')}\u2192{ce.get('new','?')}", "clock_advance")
+    else: add(f"  \u2699\ufe0f  {en}: {r.get('note', r.get('status','ran'))}", "engine")
+
+
+def _day_cadence(add, step, r):
+    for cr in step.get("results", []):
+        if "error" not in cr:
+            add(f"  \u23f0 {cr['clock']}: {cr['old']}\u2192{cr['new']}/{cr['max']}", "clock_advance")
+            if cr.get("trigger_fired"): add(f"     \U0001f525 TRIGGER: {cr.get('trigger_text','')}", "trigger")
+
+
+def _day_audit(add, step, r):
+    for a in r.get("auto_advanced", []):
+        ar = a["advance_result"]
+        add(f"  \U0001f50d {a['clock']}: {ar['old']}\u2192{ar['new']}/{ar.get('max','?')}", "clock_advance")
+        if ar.get("trigger_fired"): add(f"     \U0001f525 TRIGGER: {ar.get('trigger_text','')}", "trigger")
+    for rv in r.get("needs_llm_review", []): add(f"  \u2753 {rv['clock']}: needs Claude ({len(rv['ambiguous_bullets'])} bullets)", "llm")
+    if not r.get("auto_advanced") and not r.get("needs_llm_review"): add(f"  \U0001f50d Audit: no advances", "dim")
+
+
+def _day_encounter(add, step, r):
+    rv = r["roll"]["total"]
+    if r["passed"]: add(f"  \u2694\ufe0f  Encounter: PASS (d6={rv}) \u2192 {_clip(r.get('encounter',{}).get('description','no table'), 55)}", "encounter")
+    else: add(f"  \u2694\ufe0f  Encounter: fail (d6={rv})", "dim")
+
+
+def _day_npag(add, step, r):
+    rv = r["roll"]["total"]
+    if r["passed"]: add(f"  \U0001f465 NPAG: PASS (d6={rv}) \u2192 {r['npc_count']['count']} NPCs", "npag")
+    else: add(f"  \U0001f465 NPAG: fail (d6={rv})", "dim")
+
+
+_DAY_STEP_DISPATCH = {
+    "date_advance": _day_date_advance,
+    "cadence_clocks": _day_cadence,
+    "clock_audit": _day_audit,
+    "encounter_gate": _day_encounter,
+    "npag_gate": _day_npag,
+}
+
+
+def _fingerprint_world(s):
+    """What the World tab shows, as a tuple: equal tuples, same rows."""
+    pc = s.pc_state
+    return (
+        (pc.name, pc.reputation, pc.equipment_notes, tuple(pc.conditions), tuple(pc.goals)) if pc else None,
+        tuple((r.id, r.npc_a, r.npc_b, r.rel_type, r.visibility, r.current_state) for r in s.relationships.values()),
+        tuple((d.id, d.info, getattr(d, "certainty", None)) for d in s.discoveries),
+        tuple((t.id, t.description, t.zone, t.resolved) for t in s.unresolved_threads),
+        tuple((l.get("description"), l.get("session")) for l in s.losses_irreversibles),
+    )
+
+
+def _paint_row(c, y, spec, tag):
+    """Draw one list row spec onto canvas c at y, all items tagged tag.
+    Specs: ("sep",), ("label", text, fg, font), ("clock", name, fg,
+    fill_w, fill_color, progress_text, max_progress) and ("cols",
+    (x, text, fg, font), ...)."""
+    kind, mid = spec[0], y + ROW_H // 2
+    if kind == "sep":
+        c.create_line(0, mid, c.winfo_width(), mid, fill=COLORS["border"], tags=tag)
+    elif kind == "label":
+        _, text, fg, font = spec
+        c.create_text(4, mid, text=text, fill=fg, font=font, anchor=tk.W, tags=tag)
+    elif kind == "clock":
+        _, nm, clr, fw, fc, pt, mx = spec
+        c.create_text(4, mid, text=nm, fill=clr, font=F9, anchor=tk.W, tags=tag)
+        x0, y0 = CLOCK_BAR_X, y + (ROW_H - CLOCK_BAR_H) // 2
+        c.create_rectangle(x0, y0, x0 + CLOCK_BAR_W, y0 + CLOCK_BAR_H, fill=COLORS["clock_bg"], outline="", tags=tag)
+        if fw > 0: c.create_rectangle(x0, y0, x0 + fw, y0 + CLOCK_BAR_H, fill=fc, outline="", tags=tag)
+        for i in range(1, mx):
+            x = x0 + int((i / mx) * CLOCK_BAR_W); c.create_line(x, y0, x, y0 + CLOCK_BAR_H, fill=COLORS["border"], tags=tag)
+        c.create_text(x0 + CLOCK_BAR_W + 8, mid, text=pt, fill=clr, font=F9B, anchor=tk.W, tags=tag)
+    else:
+        for x, text, fg, font in spec[1:]:
+            c.create_text(x, mid, text=text, fill=fg, font=font, anchor=tk.W, tags=tag)
+
+
+class _RowView:
+    """Virtualized list on a Canvas. Rows are spec tuples laid out at
+    i * ROW_H; only rows overlapping the viewport have canvas items.
+    Drawn rows are pooled by spec: set_rows() shifts a row whose spec
+    merely moved to another index and redraws only new or changed ones."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.rows = []
+        self.drawn = {}      # row index -> (spec, canvas tag) currently drawn
+        self._tags = itertools.count()
+        canvas.bind("<Configure>", self.render, add="+")
+
+    def _window(self):
+        c = self.canvas
+        first = max(int(c.canvasy(0)) // ROW_H, 0)
+        return first, min(first + c.winfo_height() // ROW_H + 2, len(self.rows))
+
+    def set_rows(self, rows):
+        if rows == self.rows: return
+        c, old = self.canvas, self.drawn
+        self.rows, self.drawn = rows, {}
+        pool = {}
+        for i, (spec, tag) in old.items(): pool.setdefault(spec, []).append((i, tag))
+        first, last = self._window()
+        for j in range(first, last):
+            hit = pool.get(rows[j])
+            if hit:
+                i, tag = hit.pop()
+                if i != j: c.move(tag, 0, (j - i) * ROW_H)
+                self.drawn[j] = (rows[j], tag)
+        for left in pool.values():
+            for _, tag in left: c.delete(tag)
+        c.configure(scrollregion=(0, 0, c.winfo_width(), len(rows) * ROW_H))
+        self.render()
+
+    def render(self, *_):
+        c, drawn, rows = self.canvas, self.drawn, self.rows
+        first, last = self._window()
+        for i in [i for i in drawn if not first <= i < last]:
+            c.delete(drawn.pop(i)[1])
+        for i in range(first, last):
+            if i not in drawn:
+                tag = f"row{next(self._tags)}"
+                _paint_row(c, i * ROW_H, rows[i], tag)
+                drawn[i] = (rows[i], tag)
+
 
 class MacrosGUI:
     def __init__(self):
+        self._loaded_from = None       # save name picked by _auto_load_state
         self.state = self._auto_load_state()
         self.pending_llm_requests = []
         self.day_logs = []
-        self._last_save_mtime = 0
+        self._last_save_mtime_ns = 0     # integer ns: exact equality, no float rounding
+        self._save_cache = {"dir_mtime_ns": -1, "newest_path": None, "newest_mtime_ns": 0}
+        self._last_save_path = None
+        self._observer = None
+        self._reload_pending_after_id = None
+        self._log_since_trim = 0
+        self._state_rev = 0          # bumped by _refresh_all on every state change
+        self._sorted_cache = {}
+        self._refresh_pending = False
+        self._saved_as = None        # (_state_rev, path) of the last save written
+        # Per-tab redraw bookkeeping (Clocks, NPCs, Factions, World): a tab
+        # is redrawn only when its data fingerprint changed, and only once
+        # it is the visible tab.
+        self._tab_fps = [None] * 4
+        self._dirty = set()
+        # Save and pending-file writes/clears run here, one at a time and in order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="macros-io")
+        self._worker = None          # name of the running background job, if any
+        # Other threads never touch Tk: they queue (fn, args) here via
+        # _call_on_tk and the Tk thread runs them from _poll_tk_calls
+        self._tk_calls = queue.SimpleQueue()
         self.root = tk.Tk()
         self.root.title("MACROS Engine v2.0 \u2014 Gammaria Campaign")
         self.root.configure(bg=COLORS["bg_dark"])
         self.root.geometry("1400x900")
         self.root.minsize(1100, 750)
+        self._fonts = [tkfont.Font(self.root, name=name, family="Consolas", size=size, weight=weight, slant=slant)
+                       for name, (size, weight, slant) in FONT_SPECS.items()]
         self.style = ttk.Style()
         self.style.theme_use("clam")
         self._configure_styles()
         self._build_ui()
         self._refresh_all()
-        if hasattr(self, '_loaded_from'):
+        if self._loaded_from:
             self._log(f"\U0001f4c2 Loaded save: {self._loaded_from}", "engine")
         else:
             self._log(f"\U0001f4c2 Loaded default: Session 7 (23rd Ilrym)", "dim")
         self._replay_adjudication_log()
-        self._last_save_mtime = self._get_newest_save_mtime()
+        self._last_save_mtime_ns = self._get_newest_save()[1]
         self._start_file_watcher()
+        self._poll_tk_calls()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ── State loading / file watching (unchanged) ──
 
     def _auto_load_state(self):
-        dd = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-        if os.path.isdir(dd):
-            saves = [f for f in os.listdir(dd) if f.startswith("save_") and f.endswith(".json")]
-            if saves:
-                saves.sort(key=lambda f: os.path.getmtime(os.path.join(dd, f)), reverse=True)
+        if os.path.isdir(_DATA_DIR):
+            newest = max((e for e in _iter_saves() if e.name.startswith("save_")),
+                         key=_save_mtime, default=None)
+            if newest is not None:
                 try:
-                    with open(os.path.join(dd, saves[0]), "r") as f:
+                    with open(newest.path, "rb") as f:
                         state = state_from_json(f.read())
-                    self._loaded_from = saves[0]
+                    self._loaded_from = newest.name
                     return state
                 except Exception:
                     pass
         return load_gammaria_state()
 
     def _get_data_dir(self):
-        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-
-    def _get_newest_save_mtime(self):
-        dd = self._get_data_dir()
-        if not os.path.isdir(dd): return 0
-        saves = [f for f in os.listdir(dd) if f.endswith(".json") and (f.startswith("save_") or f.startswith("Session"))]
-        if not saves: return 0
-        saves.sort(key=lambda f: os.path.getmtime(os.path.join(dd, f)), reverse=True)
-        return os.path.getmtime(os.path.join(dd, saves[0]))
-
-    def _get_newest_save_path(self):
-        dd = self._get_data_dir()
-        if not os.path.isdir(dd): return None
-        saves = [f for f in os.listdir(dd) if f.endswith(".json") and (f.startswith("save_") or f.startswith("Session"))]
-        if not saves: return None
-        saves.sort(key=lambda f: os.path.getmtime(os.path.join(dd, f)), reverse=True)
-        return os.path.join(dd, saves[0])
+        return _DATA_DIR
+
+    def _get_newest_save(self):
+        """(path, mtime_ns) of the newest save in data/, or (None, 0).
+
+        The scan is keyed on data/'s own mtime, which moves when saves are
+        added, removed or renamed into place; on a hit only the cached
+        newest file is re-stat'ed, so in-place rewrites of it still count."""
+        cache = self._save_cache
+        try: dir_mtime_ns = os.stat(_DATA_DIR).st_mtime_ns
+        except OSError: return None, 0
+        if dir_mtime_ns == cache["dir_mtime_ns"]:
+            path = cache["newest_path"]
+            if path is None: return None, 0
+            try: return path, os.stat(path).st_mtime_ns
+            except OSError: pass
+        e = max(_iter_saves(), key=_save_mtime, default=None)
+        newest, newest_mtime_ns = (e.path, _save_mtime(e)) if e else (None, 0)
+        cache.update(dir_mtime_ns=dir_mtime_ns, newest_path=newest, newest_mtime_ns=newest_mtime_ns)
+        return newest, newest_mtime_ns
 
     def _start_file_watcher(self):
+        """Native change events via watchdog when installed (PollingObserver
+        where inotify & co. are unavailable, e.g. NFS); else the 2 s poll."""
+        dd = _DATA_DIR
+        if Observer is not None and os.path.isdir(dd):
+            for cls, kw in ((Observer, {}), (PollingObserver, {"timeout": 30})):
+                try:
+                    obs = cls(**kw)
+                    obs.schedule(_SaveEvents(self), dd, recursive=False)
+                    obs.start()
+                except OSError:
+                    continue
+                self._observer = obs
+                return
         self._check_for_changes()
 
+    def _schedule_reload(self, path):
+        """Coalesce change events: a run_day or MCP burst rewrites the save
+        several times, reload once RELOAD_DEBOUNCE_MS after the last one."""
+        if self._reload_pending_after_id is not None:
+            self.root.after_cancel(self._reload_pending_after_id)
+        self._reload_pending_after_id = self.root.after(RELOAD_DEBOUNCE_MS, self._on_save_event, path)
+
+    def _on_save_event(self, path):
+        """Reload the newest save if its mtime differs from the last one
+        seen; != rather than > so a save whose mtime went backwards
+        (restored from backup, newer one deleted) reloads too. path is
+        the file that changed: an in-place rewrite of an older save makes
+        it the newest without touching data/'s own mtime."""
+        self._reload_pending_after_id = None
+        if self._worker is not None: self._schedule_reload(path); return
+        newest, mtime_ns = self._get_newest_save()
+        try:
+            ev_ns = os.stat(path).st_mtime_ns
+            if ev_ns > mtime_ns: newest, mtime_ns = path, ev_ns
+        except OSError: pass
+        if newest and mtime_ns != self._last_save_mtime_ns:
+            self._last_save_mtime_ns = mtime_ns
+            self._last_save_path = newest
+            self._auto_reload(newest)
+
+    def _on_close(self):
+        if self._observer is not None:
+            self._observer.stop(); self._observer.join(timeout=2)
+        self._io_executor.shutdown(wait=True)
+        self._drain_tk_calls()       # last save/pending-file results, before the window goes
+        self.root.destroy()
+
+    # ── Hand-off from other threads to the Tk thread ──
+
+    def _call_on_tk(self, fn, *args):
+        """Run fn(*args) on the Tk thread. Safe from any thread (and while
+        the Tk thread is blocked in _on_close): it only enqueues."""
+        self._tk_calls.put((fn, args))
+
+    def _drain_tk_calls(self):
+        while True:
+            try: fn, args = self._tk_calls.get_nowait()
+            except queue.Empty: return
+            fn(*args)
+
+    def _poll_tk_calls(self):
+        try: self._drain_tk_calls()
+        finally: self.root.after(TK_CALL_POLL_MS, self._poll_tk_calls)
+
+    # ── Background work: one T&P run or prompt build at a time ──
+
+    def _start_worker(self, what, fn, done, *args):
+        """Run fn(*args) on a daemon thread; done(result) runs on the Tk
+        thread afterwards. Until then _busy() holds off anything else that
+        touches self.state."""
+        self._worker = what
+        def run():
+            try: res, err = fn(*args), None
+            except Exception as e: res, err = None, e
+            self._call_on_tk(self._worker_done, done, res, err)
+        threading.Thread(target=run, daemon=True, name="macros-worker").start()
+
+    def _worker_done(self, done, res, err):
+        what, self._worker = self._worker, None
+        if err is None: done(res); return
+        self._log(f"\u274c {what} failed: {err}", "trigger")
+        self._refresh_all()
+
+    def _busy(self):
+        if self._worker is None: return False
+        self._log(f"\u23f3 {self._worker} still running\u2026", "dim")
+        return True
+
+    def _submit_io(self, fn, *args):
+        self._io_executor.submit(fn, *args).add_done_callback(self._io_done)
+
+    def _io_done(self, fut):
+        e = fut.exception()
+        if e is not None: self._call_on_tk(self._log, f"\u274c Pending file update failed: {e}", "trigger")
+
     def _check_for_changes(self):
         try:
-            current_mtime = self._get_newest_save_mtime()
-            if current_mtime > self._last_save_mtime:
-                self._last_save_mtime = current_mtime
-                path = self._get_newest_save_path()
-                if path: self._auto_reload(path)
+            path, current_mtime_ns = self._get_newest_save()
+            if path and current_mtime_ns != self._last_save_mtime_ns:
+                self._schedule_reload(path)
         except Exception: pass
         self.root.after(2000, self._check_for_changes)
 
     def _auto_reload(self, filepath):
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
+            with open(filepath, "rb") as f:
                 new_state = state_from_json(f.read())
             old_date = self.state.in_game_date
-            old_log_count = len(self.state.adjudication_log) if hasattr(self.state, 'adjudication_log') else 0
+            old_log_count = len(self.state.adjudication_log)
             self.state = new_state
             self._refresh_all()
             fname = os.path.basename(filepath)
-            new_log_count = len(self.state.adjudication_log) if hasattr(self.state, 'adjudication_log') else 0
+            new_log_count = len(self.state.adjudication_log)
             if new_log_count > old_log_count or self.state.in_game_date != old_date:
                 self._log(f"\U0001f504 MCP sync: {fname} ({self.state.in_game_date})", "engine")
                 self._replay_adjudication_log(skip=old_log_count)
@@ -194,11 +639,11 @@ class MacrosGUI:
             self._log(f"\u274c Auto-reload failed: {e}", "trigger")
 
     def _replay_adjudication_log(self, skip=0):
-        if not hasattr(self.state, 'adjudication_log'): return
         log = self.state.adjudication_log
         if not log: return
         entries = log[skip:]
         if not entries: return
+        out = []
         for entry in entries:
             etype = entry.get("type", "?")
             if etype == "T&P":
@@ -208,43 +653,31 @@ class MacrosGUI:
                     "steps": entry.get("steps", []),
                     "llm_requests": [None] * entry.get("llm_requests", 0),
                 }
-                self._log_day(day_log)
+                out += self._day_lines(day_log)
             else:
-                tag = EVENT_TAG_MAP.get(etype, "dim")
-                icon = EVENT_ICON_MAP.get(etype, "\u25aa")
-                detail = entry.get("detail", "")
-                if etype == "CLOCK_ADVANCE" and "clock" in entry:
-                    self._log(f"  {icon} {entry['clock']}: {entry.get('old','?')}\u2192{entry.get('new','?')}", tag)
-                    if entry.get("trigger_fired"):
-                        self._log(f"     \U0001f525 TRG: {entry.get('trigger_text','')}", "trigger")
-                elif etype == "DICE" and "expression" in entry:
-                    self._log(f"  {icon} {entry['expression']} = {entry.get('dice',[])} = {entry.get('total','?')}", tag)
-                elif etype == "ZONE_CHANGE" and "old_zone" in entry:
-                    self._log(f"  {icon} Zone: {entry['old_zone']} \u2192 {entry['new_zone']}", tag)
-                elif detail:
-                    self._log(f"  {icon} [{etype}] {detail}", tag)
-                else:
-                    self._log(f"  {icon} [{etype}]", tag)
+                tag, icon = EVENT_META.get(etype, EVENT_META_DEFAULT)
+                out += _REPLAY_DISPATCH.get(etype, _fmt_default)(entry, etype, tag, icon)
+        self._log_batch(out)
 
     # ── Styles ──
 
     def _configure_styles(self):
         S = self.style
         S.configure("Dark.TFrame", background=COLORS["bg_dark"])
-        S.configure("Dark.TLabel", background=COLORS["bg_dark"], foreground=COLORS["text"], font=("Consolas", 10))
-        S.configure("Title.TLabel", background=COLORS["bg_dark"], foreground=COLORS["gold"], font=("Consolas", 14, "bold"))
-        S.configure("Header.TLabel", background=COLORS["bg_dark"], foreground=COLORS["accent"], font=("Consolas", 11, "bold"))
-        S.configure("Dim.TLabel", background=COLORS["bg_dark"], foreground=COLORS["text_dim"], font=("Consolas", 9))
-        S.configure("Action.TButton", background=COLORS["button_bg"], foreground=COLORS["text_bright"], font=("Consolas", 10, "bold"), padding=(12, 6))
+        S.configure("Dark.TLabel", background=COLORS["bg_dark"], foreground=COLORS["text"], font=F10)
+        S.configure("Title.TLabel", background=COLORS["bg_dark"], foreground=COLORS["gold"], font=F14B)
+        S.configure("Header.TLabel", background=COLORS["bg_dark"], foreground=COLORS["accent"], font=F11B)
+        S.configure("Dim.TLabel", background=COLORS["bg_dark"], foreground=COLORS["text_dim"], font=F9)
+        S.configure("Action.TButton", background=COLORS["button_bg"], foreground=COLORS["text_bright"], font=F10B, padding=(12, 6))
         S.map("Action.TButton", background=[("active", COLORS["button_active"]), ("pressed", COLORS["accent"])])
-        S.configure("Claude.TButton", background="#4a1942", foreground=COLORS["accent2"], font=("Consolas", 10, "bold"), padding=(12, 6))
+        S.configure("Claude.TButton", background="#4a1942", foreground=COLORS["accent2"], font=F10B, padding=(12, 6))
         S.map("Claude.TButton", background=[("active", "#6b2462"), ("pressed", COLORS["accent"])])
-        S.configure("Small.TButton", background=COLORS["button_bg"], foreground=COLORS["text"], font=("Consolas", 9), padding=(8, 4))
+        S.configure("Small.TButton", background=COLORS["button_bg"], foreground=COLORS["text"], font=F9, padding=(8, 4))
         S.map("Small.TButton", background=[("active", COLORS["button_active"])])
         # Notebook styling
         S.configure("Dark.TNotebook", background=COLORS["bg_dark"], borderwidth=0)
         S.configure("Dark.TNotebook.Tab", background=COLORS["bg_medium"], foreground=COLORS["text_dim"],
-                     font=("Consolas", 9, "bold"), padding=(10, 4))
+                     font=F9B, padding=(10, 4))
         S.map("Dark.TNotebook.Tab",
                background=[("selected", COLORS["bg_light"]), ("active", COLORS["bg_light"])],
                foreground=[("selected", COLORS["gold"]), ("active", COLORS["text_bright"])])
@@ -268,34 +701,32 @@ class MacrosGUI:
         self.notebook = ttk.Notebook(left, style="Dark.TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True)
 
-        # Tab 1: Clocks & Engines
-        self._build_clocks_tab()
-        # Tab 2: NPCs
-        self._build_npcs_tab()
-        # Tab 3: Factions
-        self._build_factions_tab()
-        # Tab 4: World
-        self._build_world_tab()
+        # Tabs: Clocks & Engines, NPCs, Factions, World. Only the empty tab
+        # frames exist up front; each tab's widgets are built the first
+        # time it is shown (see _draw_visible_tab).
+        self._tabs = []
+        for text in (" \u23f0 Clocks ", " \U0001f464 NPCs ", " \U0001f3db\ufe0f Factions ", " \U0001f30d World "):
+            tab = tk.Frame(self.notebook, bg=COLORS["bg_dark"])
+            self.notebook.add(tab, text=text)
+            self._tabs.append(tab)
+        self._tab_build = (self._build_clocks_tab, self._build_npcs_tab, self._build_factions_tab, self._build_world_tab)
+        self._tab_built = [False] * 4
+        self._scroll_canvases = set()
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_class("ScrollAny", seq, self._on_wheel)
+        self._tab_draw = (self._draw_clocks_tab, self._draw_npcs, self._draw_factions, self._draw_world)
+        self.notebook.bind("<<NotebookTabChanged>>", self._draw_visible_tab)
 
         # RIGHT: Action Log
         right = ttk.Frame(middle, style="Dark.TFrame", width=480); right.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(4, 0)); right.pack_propagate(False)
         ttk.Label(right, text="ACTION LOG", style="Header.TLabel").pack(anchor=tk.W)
-        self.log_text = scrolledtext.ScrolledText(right, wrap=tk.WORD, font=("Consolas", 9), bg=COLORS["bg_medium"], fg=COLORS["text"], insertbackground=COLORS["text"], selectbackground=COLORS["bg_light"], relief=tk.FLAT, bd=0, padx=8, pady=8)
+        self.log_text = scrolledtext.ScrolledText(right, wrap=tk.WORD, font=F9, bg=COLORS["bg_medium"], fg=COLORS["text"], insertbackground=COLORS["text"], selectbackground=COLORS["bg_light"], relief=tk.FLAT, bd=0, padx=8, pady=8)
         self.log_text.pack(fill=tk.BOTH, expand=True, pady=(4, 0))
-        for tag, cfg in [
-            ("header", {"foreground": COLORS["gold"], "font": ("Consolas", 10, "bold")}),
-            ("engine", {"foreground": COLORS["blue"]}),
-            ("clock_advance", {"foreground": COLORS["green"]}),
-            ("trigger", {"foreground": COLORS["red"], "font": ("Consolas", 9, "bold")}),
-            ("encounter", {"foreground": COLORS["orange"]}),
-            ("npag", {"foreground": COLORS["purple"]}),
-            ("dice", {"foreground": COLORS["yellow"]}),
-            ("dim", {"foreground": COLORS["text_dim"]}),
-            ("llm", {"foreground": COLORS["accent2"], "font": ("Consolas", 9, "italic")}),
-            ("claude", {"foreground": "#cc88ff", "font": ("Consolas", 9, "bold")}),
-            ("forge", {"foreground": COLORS["cyan"]}),
-        ]:
-            self.log_text.tag_configure(tag, **cfg)
+        # All tag styles in one Tcl eval instead of a round trip per tag
+        w = self.log_text._w
+        self.log_text.tk.eval("\n".join(
+            f"{w} tag configure {tag} -foreground {fg}" + (f" -font {{{font}}}" if font else "")
+            for tag, fg, font in LOG_TAG_STYLES))
 
         # Bottom bar
         bottom = ttk.Frame(main, style="Dark.TFrame"); bottom.pack(fill=tk.X, pady=(8, 0))
@@ -303,7 +734,7 @@ class MacrosGUI:
         ttk.Button(bottom, text="\u25b6\u25b6  Run 3 Days", style="Action.TButton", command=lambda: self._run_days(3)).pack(side=tk.LEFT, padx=(0, 4))
         ttk.Label(bottom, text="Days:", style="Dark.TLabel").pack(side=tk.LEFT, padx=(12, 2))
         self.days_var = tk.StringVar(value="1")
-        tk.Entry(bottom, textvariable=self.days_var, width=4, bg=COLORS["bg_entry"], fg=COLORS["text"], insertbackground=COLORS["text"], font=("Consolas", 10), relief=tk.FLAT, bd=2).pack(side=tk.LEFT, padx=(0, 2))
+        tk.Entry(bottom, textvariable=self.days_var, width=4, bg=COLORS["bg_entry"], fg=COLORS["text"], insertbackground=COLORS["text"], font=F10, relief=tk.FLAT, bd=2).pack(side=tk.LEFT, padx=(0, 2))
         ttk.Button(bottom, text="Run", style="Small.TButton", command=self._run_n_days).pack(side=tk.LEFT, padx=(0, 8))
         ttk.Button(bottom, text="\U0001f916 Ask Claude", style="Claude.TButton", command=self._ask_claude).pack(side=tk.LEFT, padx=(8, 4))
         ttk.Button(bottom, text="\U0001f4e5 Import Response", style="Claude.TButton", command=self._import_response).pack(side=tk.LEFT, padx=(0, 4))
@@ -315,121 +746,125 @@ class MacrosGUI:
         ttk.Button(bottom, text="2d6", style="Small.TButton", command=self._roll_2d6).pack(side=tk.RIGHT, padx=(4, 0))
         ttk.Button(bottom, text="d6", style="Small.TButton", command=self._roll_d6).pack(side=tk.RIGHT, padx=(4, 0))
 
-    # ── Tab 1: Clocks & Engines ──
+    # ── Mouse wheel: one class binding for every scroll area ──
+
+    def _scrollable(self, *widgets):
+        for w in widgets: w.bindtags(("ScrollAny",) + w.bindtags())
+
+    def _scroll_canvas(self, canvas, *widgets):
+        """Register canvas as a wheel-scroll target; widgets scroll it too."""
+        self._scroll_canvases.add(canvas)
+        self._scrollable(canvas, *widgets)
 
-    def _build_clocks_tab(self):
-        tab = tk.Frame(self.notebook, bg=COLORS["bg_dark"])
-        self.notebook.add(tab, text=" \u23f0 Clocks ")
+    def _on_wheel(self, e):
+        """Scroll whichever tab canvas the widget under the pointer sits in.
+        X11 reports the wheel as buttons 4/5 instead of <MouseWheel>."""
+        w = e.widget
+        while w is not None and w not in self._scroll_canvases: w = getattr(w, "master", None)
+        if w is None: return
+        step = -1 if e.num == 4 else 1 if e.num == 5 else -1 * (e.delta // 120)
+        w.yview_scroll(step, "units")
 
+    # ── Tab 1: Clocks & Engines ──
+
+    def _build_clocks_tab(self, tab):
         ch = tk.Frame(tab, bg=COLORS["bg_dark"]); ch.pack(fill=tk.X, padx=4, pady=(4, 0))
-        tk.Label(ch, text="CLOCKS & PRESSURE", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 11, "bold")).pack(side=tk.LEFT)
-        self.clock_count_label = tk.Label(ch, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9))
+        tk.Label(ch, text="CLOCKS & PRESSURE", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=F11B).pack(side=tk.LEFT)
+        self.clock_count_label = tk.Label(ch, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=F9)
         self.clock_count_label.pack(side=tk.RIGHT)
 
         cf = tk.Frame(tab, bg=COLORS["bg_dark"]); cf.pack(fill=tk.BOTH, expand=True, padx=4, pady=(4, 4))
         self.clock_canvas = tk.Canvas(cf, bg=COLORS["bg_dark"], highlightthickness=0, bd=0)
         csb = ttk.Scrollbar(cf, orient=tk.VERTICAL, command=self.clock_canvas.yview)
-        self.clock_inner = tk.Frame(self.clock_canvas, bg=COLORS["bg_dark"])
-        self.clock_inner.bind("<Configure>", lambda e: self.clock_canvas.configure(scrollregion=self.clock_canvas.bbox("all")))
-        self.clock_canvas.create_window((0, 0), window=self.clock_inner, anchor="nw")
-        self.clock_canvas.configure(yscrollcommand=csb.set)
+        self.clock_canvas.configure(yscrollcommand=lambda *a: (csb.set(*a), self.clock_view.render()))
         self.clock_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True); csb.pack(side=tk.RIGHT, fill=tk.Y)
-        def _mw(e): self.clock_canvas.yview_scroll(-1 * (e.delta // 120), "units")
-        self.clock_canvas.bind("<MouseWheel>", _mw); self.clock_inner.bind("<MouseWheel>", _mw)
-        self._mw = _mw
+        self._scroll_canvas(self.clock_canvas)
+        self.clock_view = _RowView(self.clock_canvas)
 
         # Engines section at bottom of clocks tab
         ef = tk.Frame(tab, bg=COLORS["bg_dark"]); ef.pack(fill=tk.X, padx=4, pady=(0, 4))
-        tk.Label(ef, text="ENGINES", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 11, "bold")).pack(anchor=tk.W)
-        self.engine_frame = tk.Frame(ef, bg=COLORS["bg_dark"]); self.engine_frame.pack(fill=tk.X, pady=(4, 0))
+        tk.Label(ef, text="ENGINES", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=F11B).pack(anchor=tk.W)
+        self.engine_canvas = tk.Canvas(ef, height=0, bg=COLORS["bg_dark"], highlightthickness=0, bd=0)
+        self.engine_canvas.pack(fill=tk.X, pady=(4, 0))
+        self.engine_view = _RowView(self.engine_canvas)
 
     # ── Tab 2: NPCs ──
 
-    def _build_npcs_tab(self):
-        tab = tk.Frame(self.notebook, bg=COLORS["bg_dark"])
-        self.notebook.add(tab, text=" \U0001f464 NPCs ")
-
+    def _build_npcs_tab(self, tab):
         hdr = tk.Frame(tab, bg=COLORS["bg_dark"]); hdr.pack(fill=tk.X, padx=4, pady=(4, 0))
-        tk.Label(hdr, text="NPCs & COMPANIONS", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 11, "bold")).pack(side=tk.LEFT)
-        self.npc_count_label = tk.Label(hdr, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9))
+        tk.Label(hdr, text="NPCs & COMPANIONS", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=F11B).pack(side=tk.LEFT)
+        self.npc_count_label = tk.Label(hdr, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=F9)
         self.npc_count_label.pack(side=tk.RIGHT)
 
         cf = tk.Frame(tab, bg=COLORS["bg_dark"]); cf.pack(fill=tk.BOTH, expand=True, padx=4, pady=(4, 4))
         self.npc_canvas = tk.Canvas(cf, bg=COLORS["bg_dark"], highlightthickness=0, bd=0)
         nsb = ttk.Scrollbar(cf, orient=tk.VERTICAL, command=self.npc_canvas.yview)
-        self.npc_inner = tk.Frame(self.npc_canvas, bg=COLORS["bg_dark"])
-        self.npc_inner.bind("<Configure>", lambda e: self.npc_canvas.configure(scrollregion=self.npc_canvas.bbox("all")))
-        self.npc_canvas.create_window((0, 0), window=self.npc_inner, anchor="nw")
-        self.npc_canvas.configure(yscrollcommand=nsb.set)
+        self.npc_canvas.configure(yscrollcommand=lambda *a: (nsb.set(*a), self.npc_view.render()))
         self.npc_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True); nsb.pack(side=tk.RIGHT, fill=tk.Y)
-        def _npc_mw(e): self.npc_canvas.yview_scroll(-1 * (e.delta // 120), "units")
-        self.npc_canvas.bind("<MouseWheel>", _npc_mw); self.npc_inner.bind("<MouseWheel>", _npc_mw)
-        self._npc_mw = _npc_mw
+        self._scroll_canvas(self.npc_canvas)
+        self.npc_view = _RowView(self.npc_canvas)
 
     # ── Tab 3: Factions ──
 
-    def _build_factions_tab(self):
-        tab = tk.Frame(self.notebook, bg=COLORS["bg_dark"])
-        self.notebook.add(tab, text=" \U0001f3db\ufe0f Factions ")
-
+    def _build_factions_tab(self, tab):
         hdr = tk.Frame(tab, bg=COLORS["bg_dark"]); hdr.pack(fill=tk.X, padx=4, pady=(4, 0))
-        tk.Label(hdr, text="FACTIONS", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 11, "bold")).pack(side=tk.LEFT)
-        self.fac_count_label = tk.Label(hdr, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9))
+        tk.Label(hdr, text="FACTIONS", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=F11B).pack(side=tk.LEFT)
+        self.fac_count_label = tk.Label(hdr, text="", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=F9)
         self.fac_count_label.pack(side=tk.RIGHT)
 
         cf = tk.Frame(tab, bg=COLORS["bg_dark"]); cf.pack(fill=tk.BOTH, expand=True, padx=4, pady=(4, 4))
         self.fac_canvas = tk.Canvas(cf, bg=COLORS["bg_dark"], highlightthickness=0, bd=0)
         fsb = ttk.Scrollbar(cf, orient=tk.VERTICAL, command=self.fac_canvas.yview)
-        self.fac_inner = tk.Frame(self.fac_canvas, bg=COLORS["bg_dark"])
-        self.fac_inner.bind("<Configure>", lambda e: self.fac_canvas.configure(scrollregion=self.fac_canvas.bbox("all")))
-        self.fac_canvas.create_window((0, 0), window=self.fac_inner, anchor="nw")
-        self.fac_canvas.configure(yscrollcommand=fsb.set)
+        self.fac_canvas.configure(yscrollcommand=lambda *a: (fsb.set(*a), self.fac_view.render()))
         self.fac_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True); fsb.pack(side=tk.RIGHT, fill=tk.Y)
-        def _fac_mw(e): self.fac_canvas.yview_scroll(-1 * (e.delta // 120), "units")
-        self.fac_canvas.bind("<MouseWheel>", _fac_mw); self.fac_inner.bind("<MouseWheel>", _fac_mw)
-        self._fac_mw = _fac_mw
+        self._scroll_canvas(self.fac_canvas)
+        self.fac_view = _RowView(self.fac_canvas)
 
     # ── Tab 4: World ──
 
-    def _build_world_tab(self):
-        tab = tk.Frame(self.notebook, bg=COLORS["bg_dark"])
-        self.notebook.add(tab, text=" \U0001f30d World ")
-
+    def _build_world_tab(self, tab):
         cf = tk.Frame(tab, bg=COLORS["bg_dark"]); cf.pack(fill=tk.BOTH, expand=True, padx=4, pady=(4, 4))
         self.world_canvas = tk.Canvas(cf, bg=COLORS["bg_dark"], highlightthickness=0, bd=0)
         wsb = ttk.Scrollbar(cf, orient=tk.VERTICAL, command=self.world_canvas.yview)
-        self.world_inner = tk.Frame(self.world_canvas, bg=COLORS["bg_dark"])
-        self.world_inner.bind("<Configure>", lambda e: self.world_canvas.configure(scrollregion=self.world_canvas.bbox("all")))
-        self.world_canvas.create_window((0, 0), window=self.world_inner, anchor="nw")
-        self.world_canvas.configure(yscrollcommand=wsb.set)
+        self.world_canvas.configure(yscrollcommand=lambda *a: (wsb.set(*a), self.world_view.render()))
         self.world_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True); wsb.pack(side=tk.RIGHT, fill=tk.Y)
-        def _world_mw(e): self.world_canvas.yview_scroll(-1 * (e.delta // 120), "units")
-        self.world_canvas.bind("<MouseWheel>", _world_mw); self.world_inner.bind("<MouseWheel>", _world_mw)
-        self._world_mw = _world_mw
+        self._scroll_canvas(self.world_canvas)
+        self.world_view = _RowView(self.world_canvas)
 
     # ── Drawing: Clocks ──
 
-    def _draw_clocks(self):
-        for w in self.clock_inner.winfo_children(): w.destroy()
+    def _sorted(self, kind, build):
+        """build() result for the current state, computed once per state
+        revision; redraws of an unchanged state reuse the sorted lists."""
+        key = (id(self.state), self._state_rev)
+        hit = self._sorted_cache.get(kind)
+        if hit is not None and hit[0] == key: return hit[1]
+        val = build()
+        self._sorted_cache[kind] = (key, val)
+        return val
+
+    def _partition_clocks(self):
         active, fired, halted = [], [], []
         for c in self.state.clocks.values():
             if c.trigger_fired: fired.append(c)
             elif c.status == "halted": halted.append(c)
             elif c.status != "retired": active.append(c)
         active.sort(key=lambda c: c.progress / max(c.max_progress, 1), reverse=True)
-        for c in active: self._clock_row(c)
+        return active, fired, halted
+
+    def _draw_clocks(self):
+        active, fired, halted = self._sorted("clocks", self._partition_clocks)
+        rows = [self._clock_spec(c) for c in active]
         if fired:
-            tk.Frame(self.clock_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.clock_inner, text="TRIGGERS FIRED", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W)
-            for c in fired: self._clock_row(c, "fired")
+            rows += [("sep",), ("label", "TRIGGERS FIRED", COLORS["text_dim"], F8)]
+            rows += [self._clock_spec(c, "fired") for c in fired]
         if halted:
-            tk.Frame(self.clock_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.clock_inner, text="HALTED", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W)
-            for c in halted: self._clock_row(c, "halted")
+            rows += [("sep",), ("label", "HALTED", COLORS["text_dim"], F8)]
+            rows += [self._clock_spec(c, "halted") for c in halted]
+        self.clock_view.set_rows(rows)
         self.clock_count_label.configure(text=f"{len(active)} active / {len(fired)} fired / {len(halted)} halted")
 
-    def _clock_row(self, clock, mode="active"):
-        row = tk.Frame(self.clock_inner, bg=COLORS["bg_dark"]); row.pack(fill=tk.X, pady=1); row.bind("<MouseWheel>", self._mw)
+    def _clock_spec(self, clock, mode="active"):
         nm = clock.name + (" \u23f0" if clock.is_cadence else "")
         pct = clock.progress / max(clock.max_progress, 1)
         if mode == "fired": clr = COLORS["text_dim"]
@@ -437,57 +872,51 @@ class MacrosGUI:
         elif pct >= 0.75: clr = COLORS["red"]
         elif pct >= 0.5: clr = COLORS["yellow"]
         else: clr = COLORS["green"]
-        lbl = tk.Label(row, text=nm, bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9), anchor=tk.W, width=45); lbl.pack(side=tk.LEFT); lbl.bind("<MouseWheel>", self._mw)
-        bw, bh = 200, 14
-        bar = tk.Canvas(row, width=bw, height=bh, bg=COLORS["clock_bg"], highlightthickness=0, bd=0); bar.pack(side=tk.LEFT, padx=4); bar.bind("<MouseWheel>", self._mw)
-        if clock.max_progress > 0:
-            fw = int(pct * bw)
-            fc = COLORS["clock_fill_fired"] if mode == "fired" else COLORS["clock_fill_red"] if pct >= 0.75 else COLORS["clock_fill_yellow"] if pct >= 0.5 else COLORS["clock_fill_green"]
-            if fw > 0: bar.create_rectangle(0, 0, fw, bh, fill=fc, outline="")
-            for i in range(1, clock.max_progress):
-                x = int((i / clock.max_progress) * bw); bar.create_line(x, 0, x, bh, fill=COLORS["border"])
+        fw = int(pct * CLOCK_BAR_W) if clock.max_progress > 0 else 0
+        fc = COLORS["clock_fill_fired"] if mode == "fired" else COLORS["clock_fill_red"] if pct >= 0.75 else COLORS["clock_fill_yellow"] if pct >= 0.5 else COLORS["clock_fill_green"]
         pt = "FIRED" if mode == "fired" else f"{clock.progress}/{clock.max_progress} HALT" if mode == "halted" else f"{clock.progress}/{clock.max_progress}"
-        pl = tk.Label(row, text=pt, bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9, "bold"), width=12); pl.pack(side=tk.LEFT); pl.bind("<MouseWheel>", self._mw)
+        return ("clock", _clip(nm, 45), clr, fw, fc, pt, max(clock.max_progress, 0))
 
     def _draw_engines(self):
-        for w in self.engine_frame.winfo_children(): w.destroy()
+        rows = []
         for e in self.state.engines.values():
-            row = tk.Frame(self.engine_frame, bg=COLORS["bg_dark"]); row.pack(fill=tk.X, pady=1)
             ic = "\u2699\ufe0f" if e.status == "active" else "\U0001f4a4" if e.status == "dormant" else "\u2b1b"
             cl = COLORS["green"] if e.status == "active" else COLORS["text_dim"]
-            tk.Label(row, text=f"{ic}  {e.name}", bg=COLORS["bg_dark"], fg=cl, font=("Consolas", 9), anchor=tk.W).pack(side=tk.LEFT)
-            tk.Label(row, text=f"[{e.version}] {e.status.upper()}", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(side=tk.RIGHT)
+            rows.append(("cols", (4, _clip(f"{ic}  {e.name}", 52), cl, F9),
+                         (CLOCK_BAR_X + 60, f"[{e.version}] {e.status.upper()}", COLORS["text_dim"], F8)))
+        self.engine_canvas.configure(height=len(rows) * ROW_H)
+        self.engine_view.set_rows(rows)
 
     # ── Drawing: NPCs ──
 
     def _draw_npcs(self):
-        for w in self.npc_inner.winfo_children(): w.destroy()
-        if not hasattr(self.state, 'npcs') or not self.state.npcs:
-            tk.Label(self.npc_inner, text="No NPCs in save file.", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9)).pack(anchor=tk.W, padx=4)
+        if not self.state.npcs:
+            self.npc_view.set_rows([("label", "No NPCs in save file.", COLORS["text_dim"], F9)])
             self.npc_count_label.configure(text="0")
             return
 
-        npcs = list(self.state.npcs.values())
-        companions = [n for n in npcs if n.is_companion]
-        others = [n for n in npcs if not n.is_companion]
-        companions.sort(key=lambda n: n.name)
-        others.sort(key=lambda n: (n.zone, n.name))
+        companions, others = self._sorted("npcs", self._partition_npcs)
 
+        rows = []
         if companions:
-            tk.Label(self.npc_inner, text="\u2605 COMPANIONS", bg=COLORS["bg_dark"], fg=COLORS["gold"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(4, 2))
-            for n in companions: self._npc_row(n)
-
+            rows.append(("label", "\u2605 COMPANIONS", COLORS["gold"], F10B))
+            rows += [self._npc_spec(n) for n in companions]
         if others:
-            tk.Frame(self.npc_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.npc_inner, text="OTHER NPCs", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9)).pack(anchor=tk.W, padx=4, pady=(0, 2))
-            for n in others: self._npc_row(n)
+            rows += [("sep",), ("label", "OTHER NPCs", COLORS["text_dim"], F9)]
+            rows += [self._npc_spec(n) for n in others]
+        self.npc_view.set_rows(rows)
 
         self.npc_count_label.configure(text=f"{len(companions)} companions / {len(others)} others")
 
-    def _npc_row(self, npc):
-        row = tk.Frame(self.npc_inner, bg=COLORS["bg_dark"]); row.pack(fill=tk.X, pady=1, padx=4)
-        row.bind("<MouseWheel>", self._npc_mw)
+    def _partition_npcs(self):
+        npcs = list(self.state.npcs.values())
+        companions = [n for n in npcs if n.is_companion]
+        others = [n for n in npcs if not n.is_companion]
+        companions.sort(key=lambda n: n.name)
+        others.sort(key=lambda n: (n.zone, n.name))
+        return companions, others
 
+    def _npc_spec(self, npc):
         # Status color
         if npc.status == "dead": clr = COLORS["red"]
         elif npc.with_pc: clr = COLORS["gold"]
@@ -499,115 +928,91 @@ class MacrosGUI:
         if npc.is_companion: badges += "\u2605 "
         if npc.with_pc: badges += "[WITH PC] "
 
-        name_text = f"{badges}{npc.name}"
-        nl = tk.Label(row, text=name_text, bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9, "bold"), anchor=tk.W, width=32)
-        nl.pack(side=tk.LEFT); nl.bind("<MouseWheel>", self._npc_mw)
-
-        zone_text = npc.zone or "—"
-        zl = tk.Label(row, text=zone_text, bg=COLORS["bg_dark"], fg=COLORS["blue"], font=("Consolas", 9), anchor=tk.W, width=18)
-        zl.pack(side=tk.LEFT); zl.bind("<MouseWheel>", self._npc_mw)
-
-        role_text = npc.role or "—"
-        rl = tk.Label(row, text=role_text, bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8), anchor=tk.W)
-        rl.pack(side=tk.LEFT, fill=tk.X, expand=True); rl.bind("<MouseWheel>", self._npc_mw)
+        return ("cols",
+                (4, _clip(f"{badges}{npc.name}", 32), clr, F9B),
+                (240, _clip(npc.zone or "—", 18), COLORS["blue"], F9),
+                (375, npc.role or "—", COLORS["text_dim"], F8))
 
     # ── Drawing: Factions ──
 
     def _draw_factions(self):
-        for w in self.fac_inner.winfo_children(): w.destroy()
-        if not hasattr(self.state, 'factions') or not self.state.factions:
-            tk.Label(self.fac_inner, text="No factions in save file.", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 9)).pack(anchor=tk.W, padx=4)
+        if not self.state.factions:
+            self.fac_view.set_rows([("label", "No factions in save file.", COLORS["text_dim"], F9)])
             self.fac_count_label.configure(text="0")
             return
 
-        facs = sorted(self.state.factions.values(), key=lambda f: f.name)
-
-        disp_colors = {
-            "friendly": COLORS["green"],
-            "neutral": COLORS["yellow"],
-            "hostile": COLORS["red"],
-            "unknown": COLORS["text_dim"],
-        }
+        facs = self._sorted("factions", lambda: sorted(self.state.factions.values(), key=lambda f: f.name))
 
+        rows = []
         for fac in facs:
-            row = tk.Frame(self.fac_inner, bg=COLORS["bg_dark"]); row.pack(fill=tk.X, pady=1, padx=4)
-            row.bind("<MouseWheel>", self._fac_mw)
-
-            clr = disp_colors.get(fac.disposition, COLORS["text"])
-            fl = tk.Label(row, text=fac.name, bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9, "bold"), anchor=tk.W, width=32)
-            fl.pack(side=tk.LEFT); fl.bind("<MouseWheel>", self._fac_mw)
-
-            disp_text = fac.disposition.upper() if fac.disposition else "—"
-            dl = tk.Label(row, text=disp_text, bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9), width=10)
-            dl.pack(side=tk.LEFT); dl.bind("<MouseWheel>", self._fac_mw)
-
-            status_text = fac.status or "—"
-            sl = tk.Label(row, text=status_text, bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8), width=10)
-            sl.pack(side=tk.LEFT); sl.bind("<MouseWheel>", self._fac_mw)
-
+            clr = DISPOSITION_COLORS.get(fac.disposition, COLORS["text"])
+            cols = [(4, _clip(fac.name, 32), clr, F9B),
+                    (240, fac.disposition.upper() if fac.disposition else "—", clr, F9),
+                    (320, _clip(fac.status or "—", 10), COLORS["text_dim"], F8)]
             if fac.notes:
-                note_text = fac.notes[:60] + ("..." if len(fac.notes) > 60 else "")
-                nl = tk.Label(row, text=note_text, bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8), anchor=tk.W)
-                nl.pack(side=tk.LEFT, fill=tk.X, expand=True); nl.bind("<MouseWheel>", self._fac_mw)
+                cols.append((400, _clip(fac.notes, 63), COLORS["text_dim"], F8))
+            rows.append(("cols", *cols))
+        self.fac_view.set_rows(rows)
 
         self.fac_count_label.configure(text=f"{len(facs)} factions")
 
     # ── Drawing: World ──
 
     def _draw_world(self):
-        for w in self.world_inner.winfo_children(): w.destroy()
         s = self.state
+        rows = []
 
         # PC State
-        if hasattr(s, 'pc_state') and s.pc_state:
+        if s.pc_state:
             pc = s.pc_state
-            tk.Label(self.world_inner, text="\u2694 PC STATE", bg=COLORS["bg_dark"], fg=COLORS["gold"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(4, 2))
-            tk.Label(self.world_inner, text=f"  {pc.name} | {pc.reputation or '—'}", bg=COLORS["bg_dark"], fg=COLORS["text"], font=("Consolas", 9)).pack(anchor=tk.W, padx=4)
+            rows.append(("label", "\u2694 PC STATE", COLORS["gold"], F10B))
+            rows.append(("label", f"  {pc.name} | {pc.reputation or '—'}", COLORS["text"], F9))
             if pc.equipment_notes:
-                tk.Label(self.world_inner, text=f"  Gear: {pc.equipment_notes}", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                rows.append(("label", f"  Gear: {pc.equipment_notes}", COLORS["text_dim"], F8))
             if pc.conditions:
-                tk.Label(self.world_inner, text=f"  Conditions: {', '.join(pc.conditions)}", bg=COLORS["bg_dark"], fg=COLORS["red"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                rows.append(("label", f"  Conditions: {', '.join(pc.conditions)}", COLORS["red"], F8))
             if pc.goals:
-                tk.Label(self.world_inner, text=f"  Goals ({len(pc.goals)}):", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                rows.append(("label", f"  Goals ({len(pc.goals)}):", COLORS["text_dim"], F8))
                 for g in pc.goals[:6]:
-                    tk.Label(self.world_inner, text=f"    \u2022 {g}", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                    rows.append(("label", f"    \u2022 {g}", COLORS["text_dim"], F8))
                 if len(pc.goals) > 6:
-                    tk.Label(self.world_inner, text=f"    ... +{len(pc.goals)-6} more", bg=COLORS["bg_dark"], fg=COLORS["text_dim"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                    rows.append(("label", f"    ... +{len(pc.goals)-6} more", COLORS["text_dim"], F8))
 
         # Relationships
-        if hasattr(s, 'relationships') and s.relationships:
-            tk.Frame(self.world_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.world_inner, text=f"\U0001f495 RELATIONSHIPS ({len(s.relationships)})", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(0, 2))
-            for rel in sorted(s.relationships.values(), key=lambda r: r.id):
-                vis_icon = "\U0001f512" if rel.visibility == "secret" else "\U0001f50d" if rel.visibility == "restricted" else ""
-                clr = COLORS["red"] if rel.rel_type in ("dislike", "hatred") else COLORS["green"] if rel.rel_type in ("love", "friends") else COLORS["yellow"]
-                tk.Label(self.world_inner, text=f"  {vis_icon} {rel.npc_a} \u2194 {rel.npc_b}: {rel.rel_type} ({rel.current_state})", bg=COLORS["bg_dark"], fg=clr, font=("Consolas", 9)).pack(anchor=tk.W, padx=4)
+        if s.relationships:
+            rows.append(("sep",))
+            rows.append(("label", f"\U0001f495 RELATIONSHIPS ({len(s.relationships)})", COLORS["accent"], F10B))
+            for rel in self._sorted("relationships", lambda: sorted(s.relationships.values(), key=lambda r: r.id)):
+                vis_icon = VISIBILITY_ICONS.get(rel.visibility, "")
+                clr = REL_COLORS.get(rel.rel_type, COLORS["yellow"])
+                rows.append(("label", f"  {vis_icon} {rel.npc_a} \u2194 {rel.npc_b}: {rel.rel_type} ({rel.current_state})", clr, F9))
 
         # Discoveries
-        if hasattr(s, 'discoveries') and s.discoveries:
-            tk.Frame(self.world_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.world_inner, text=f"\U0001f50d DISCOVERIES ({len(s.discoveries)})", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(0, 2))
+        if s.discoveries:
+            rows.append(("sep",))
+            rows.append(("label", f"\U0001f50d DISCOVERIES ({len(s.discoveries)})", COLORS["accent"], F10B))
             for disc in s.discoveries:
-                cert_clr = COLORS["green"] if disc.certainty == "confirmed" else COLORS["yellow"] if disc.certainty == "inferred" else COLORS["text_dim"]
-                info_short = disc.info[:70] + ("..." if len(disc.info) > 70 else "")
-                tk.Label(self.world_inner, text=f"  [{disc.certainty.upper()[:4]}] {info_short}", bg=COLORS["bg_dark"], fg=cert_clr, font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                cert_clr = CERTAINTY_COLORS.get(disc.certainty, COLORS["text_dim"])
+                rows.append(("label", f"  [{disc.certainty.upper()[:4]}] {_clip(disc.info, 73)}", cert_clr, F8))
 
         # Unresolved Threads
-        if hasattr(s, 'unresolved_threads') and s.unresolved_threads:
-            open_threads = [t for t in s.unresolved_threads if not t.resolved]
+        if s.unresolved_threads:
+            open_threads = self._sorted("open_threads", lambda: [t for t in s.unresolved_threads if not t.resolved])
             if open_threads:
-                tk.Frame(self.world_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-                tk.Label(self.world_inner, text=f"\U0001f9f5 OPEN THREADS ({len(open_threads)})", bg=COLORS["bg_dark"], fg=COLORS["accent"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(0, 2))
+                rows.append(("sep",))
+                rows.append(("label", f"\U0001f9f5 OPEN THREADS ({len(open_threads)})", COLORS["accent"], F10B))
                 for t in open_threads:
                     zone_tag = f" [{t.zone}]" if t.zone else ""
-                    tk.Label(self.world_inner, text=f"  \u2022 {t.description}{zone_tag}", bg=COLORS["bg_dark"], fg=COLORS["purple"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                    rows.append(("label", f"  \u2022 {t.description}{zone_tag}", COLORS["purple"], F8))
 
         # Losses
-        if hasattr(s, 'losses_irreversibles') and s.losses_irreversibles:
-            tk.Frame(self.world_inner, bg=COLORS["border"], height=1).pack(fill=tk.X, pady=4)
-            tk.Label(self.world_inner, text=f"\U0001f480 LOSSES ({len(s.losses_irreversibles)})", bg=COLORS["bg_dark"], fg=COLORS["red"], font=("Consolas", 10, "bold")).pack(anchor=tk.W, padx=4, pady=(0, 2))
+        if s.losses_irreversibles:
+            rows.append(("sep",))
+            rows.append(("label", f"\U0001f480 LOSSES ({len(s.losses_irreversibles)})", COLORS["red"], F10B))
             for loss in s.losses_irreversibles:
-                tk.Label(self.world_inner, text=f"  \u2022 {loss.get('description', '?')} (S{loss.get('session','?')})", bg=COLORS["bg_dark"], fg=COLORS["red"], font=("Consolas", 8)).pack(anchor=tk.W, padx=4)
+                rows.append(("label", f"  \u2022 {_clip(loss.get('description', '?'), 70)} (S{loss.get('session','?')})", COLORS["red"], F8))
+
+        self.world_view.set_rows(rows)
 
     # ── Meta / Pending ──
 
@@ -624,50 +1029,51 @@ class MacrosGUI:
     def _log(self, text, tag=None):
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.insert(tk.END, text + "\n", tag if tag else ())
+        self._log_since_trim += 1
+        if self._log_since_trim >= LOG_TRIM_EVERY: self._trim_log()
+        self.log_text.see(tk.END); self.log_text.configure(state=tk.DISABLED)
+
+    def _trim_log(self):
+        """Drop the oldest lines beyond LOG_MAX_LINES (widget must be NORMAL)."""
+        self._log_since_trim = 0
+        n = int(self.log_text.index("end-1c").split(".")[0])
+        if n > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{n - LOG_MAX_LINES}.0")
+
+    def _log_batch(self, lines):
+        """Append [(text, tag), ...] with one Text insert and one scroll.
+        Consecutive lines sharing a tag go in as one tagged run."""
+        if not lines: return
+        args, run, run_tag = [], [], None
+        for text, tag in lines:
+            tag = tag or ()
+            if tag != run_tag and run:
+                args += ("".join(run), run_tag); run = []
+            run_tag = tag; run.append(text + "\n")
+        args += ("".join(run), run_tag)
+        self.log_text.configure(state=tk.NORMAL)
+        self.log_text.insert(tk.END, *args)
+        self._trim_log()
         self.log_text.see(tk.END); self.log_text.configure(state=tk.DISABLED)
 
     def _log_day(self, dl):
-        self._log(f"\u2550" * 35, "header")
-        self._log(f"  DAY {dl.get('day_number','?')} \u2014 {dl.get('date','?')}", "header")
-        self._log(f"\u2550" * 35, "header")
+        self._log_batch(self._day_lines(dl))
+
+    def _day_lines(self, dl):
+        """Action-log lines [(text, tag), ...] for one T&P day log."""
+        out = []
+        def add(text, tag=None): out.append((text, tag))
+        add(DAY_RULE, "header")
+        add(f"  DAY {dl.get('day_number','?')} \u2014 {dl.get('date','?')}", "header")
+        add(DAY_RULE, "header")
         for step in dl.get("steps", []):
             sn, r = step["step"], step.get("result", step.get("results", {}))
-            if sn == "date_advance":
-                if r.get("season_changed"): self._log(f"  \U0001f4c5 {r['new_date']} \u2014 SEASON: {r['new_season']}", "engine")
-                else: self._log(f"  \U0001f4c5 {r['new_date']}", "dim")
-            elif sn.startswith("engine:"):
-                en = sn.split(":", 1)[1]
-                if r.get("skipped"): self._log(f"  \u2699\ufe0f  {en}: SKIP", "dim")
-                elif r.get("status") == "inert": self._log(f"  \u2699\ufe0f  {en}: INERT", "dim")
-                elif "roll" in r:
-                    self._log(f"  \u2699\ufe0f  {en}: 2d6={r['roll']['total']} \u2192 {r.get('outcome_band','')}", "engine")
-                    for ce in r.get("clock_effects_applied", []):
-                        if "error" in ce: self._log(f"     \u274c {ce.get('clock','?')}: {ce['error']}", "trigger")
-                        elif not ce.get("skipped"): self._log(f"     \u2192 {ce['clock']}: {ce.get('old','?')}\u2192{ce.get('new','?')}", "clock_advance")
-                else: self._log(f"  \u2699\ufe0f  {en}: {r.get('note', r.get('status','ran'))}", "engine")
-            elif sn == "cadence_clocks":
-                for cr in step.get("results", []):
-                    if "error" not in cr:
-                        self._log(f"  \u23f0 {cr['clock']}: {cr['old']}\u2192{cr['new']}/{cr['max']}", "clock_advance")
-                        if cr.get("trigger_fired"): self._log(f"     \U0001f525 TRIGGER: {cr.get('trigger_text','')}", "trigger")
-            elif sn == "clock_audit":
-                for a in r.get("auto_advanced", []):
-                    ar = a["advance_result"]
-                    self._log(f"  \U0001f50d {a['clock']}: {ar['old']}\u2192{ar['new']}/{ar.get('max','?')}", "clock_advance")
-                    if ar.get("trigger_fired"): self._log(f"     \U0001f525 TRIGGER: {ar.get('trigger_text','')}", "trigger")
-                for rv in r.get("needs_llm_review", []): self._log(f"  \u2753 {rv['clock']}: needs Claude ({len(rv['ambiguous_bullets'])} bullets)", "llm")
-                if not r.get("auto_advanced") and not r.get("needs_llm_review"): self._log(f"  \U0001f50d Audit: no advances", "dim")
-            elif sn == "encounter_gate":
-                rv = r["roll"]["total"]
-                if r["passed"]: self._log(f"  \u2694\ufe0f  Encounter: PASS (d6={rv}) \u2192 {r.get('encounter',{}).get('description','no table')[:55]}", "encounter")
-                else: self._log(f"  \u2694\ufe0f  Encounter: fail (d6={rv})", "dim")
-            elif sn == "npag_gate":
-                rv = r["roll"]["total"]
-                if r["passed"]: self._log(f"  \U0001f465 NPAG: PASS (d6={rv}) \u2192 {r['npc_count']['count']} NPCs", "npag")
-                else: self._log(f"  \U0001f465 NPAG: fail (d6={rv})", "dim")
+            handler = _DAY_STEP_DISPATCH.get(sn) or (sn.startswith("engine:") and _day_engine)
+            if handler: handler(add, step, r)
         llm = dl.get("llm_requests", [])
-        if llm: self._log(f"  \U0001f4cb {len(llm)} queued for Claude", "llm")
-        self._log("")
+        if llm: add(f"  \U0001f4cb {len(llm)} queued for Claude", "llm")
+        add("")
+        return out
 
     # ── Actions ──
 
@@ -679,37 +1085,73 @@ class MacrosGUI:
         except ValueError: messagebox.showwarning("Invalid", "Enter a number")
 
     def _run_days(self, n):
+        if self._busy(): return
         if not self.state.pc_zone: messagebox.showerror("Error", "PC Zone is blank"); return
-        self._log(f"\u2554{'=' * 37}\u2557", "header")
-        self._log(f"\u2551  TIME & PRESSURE \u2014 {n} DAY(S)         \u2551", "header")
-        self._log(f"\u2551  From: {self.state.in_game_date:<28s} \u2551", "header")
-        self._log(f"\u255a{'=' * 37}\u255d", "header")
+        self._log_batch([
+            (BOX_TOP, "header"),
+            (f"\u2551  TIME & PRESSURE \u2014 {n} DAY(S)         \u2551", "header"),
+            (f"\u2551  From: {self.state.in_game_date:<28s} \u2551", "header"),
+            (BOX_BOTTOM, "header"),
+        ])
         self.day_logs = []
+        self._start_worker("T&P", self._run_days_worker, self._days_done, self.state, n)
+
+    def _run_days_worker(self, state, n):
+        """Worker thread: run the days, handing each day log to the Tk thread."""
         for i in range(n):
-            dl = run_day(self.state); dl["day_number"] = i + 1
-            self.day_logs.append(dl); self._log_day(dl)
-            for req in dl.get("llm_requests", []): self.pending_llm_requests.append(req)
-        self._log(f"T&P complete. Date: {self.state.in_game_date}", "header")
-        if self.pending_llm_requests: self._log(f"\u26a1 {len(self.pending_llm_requests)} total pending for Claude", "llm")
-        self._log(""); self._refresh_all()
-        if self.pending_llm_requests: _write_pending_to_disk(self.pending_llm_requests, self.state, self.day_logs)
+            dl = run_day(state); dl["day_number"] = i + 1
+            self._call_on_tk(self._on_day, dl)
+
+    def _on_day(self, dl):
+        self.day_logs.append(dl); self._log_batch(self._day_lines(dl))
+        self.pending_llm_requests += dl.get("llm_requests", [])
+
+    def _days_done(self, _):
+        lines = [(f"T&P complete. Date: {self.state.in_game_date}", "header")]
+        if self.pending_llm_requests: lines.append((f"\u26a1 {len(self.pending_llm_requests)} total pending for Claude", "llm"))
+        lines.append(("", None))
+        self._log_batch(lines); self._refresh_all()
+        if self.pending_llm_requests: self._submit_io(_write_pending_to_disk, _pending_payload(self.pending_llm_requests, self.state, self.day_logs))
 
     def _ask_claude(self):
         if not self.pending_llm_requests:
             messagebox.showinfo("No Requests", "No pending items.\nRun T&P days first."); return
-        prompt = build_clipboard_prompt(self.pending_llm_requests, self.state, self.day_logs)
-        write_request(self.pending_llm_requests, self.state, self.day_logs)
-        n = len(self.pending_llm_requests)
-        types = {}
-        for r in self.pending_llm_requests: types[r.get("type","?")] = types.get(r.get("type","?"),0)+1
+        if self._busy(): return
+        reqs = list(self.pending_llm_requests)
+        self._start_worker("Prompt build", self._build_prompt, lambda prompt: self._show_prompt(reqs, prompt), reqs, self.state, self.day_logs)
+
+    @staticmethod
+    def _build_prompt(reqs, state, day_logs):
+        prompt = build_clipboard_prompt(reqs, state, day_logs)
+        write_request(reqs, state, day_logs)
+        return prompt
+
+    def _show_prompt(self, reqs, prompt):
+        n = len(reqs)
+        types = Counter(r.get("type","?") for r in reqs)
         ts = ", ".join(f"{v} {k}" for k,v in types.items())
         self._log(f"\U0001f916 Built prompt with {n} requests ({ts})", "claude")
         self._log(f"\U0001f916 Prompt size: {len(prompt):,} chars", "claude")
         win = tk.Toplevel(self.root); win.title("Ask Claude \u2014 Copy & Paste"); win.configure(bg=COLORS["bg_dark"]); win.geometry("800x600")
         ttk.Label(win, text="COPY THIS PROMPT \u2192 PASTE INTO CLAUDE", style="Header.TLabel").pack(pady=(12,4))
         ttk.Label(win, text=f"{n} requests \u00b7 {len(prompt):,} chars \u00b7 all data embedded", style="Dim.TLabel").pack(pady=(0,8))
-        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=("Consolas",9), bg=COLORS["bg_medium"], fg=COLORS["text"], relief=tk.FLAT, padx=12, pady=12, height=20)
-        txt.pack(fill=tk.BOTH, expand=True, padx=12); txt.insert(tk.END, prompt); txt.configure(state=tk.DISABLED)
+        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=F9, bg=COLORS["bg_medium"], fg=COLORS["text"], relief=tk.FLAT, padx=12, pady=12, height=20)
+        txt.pack(fill=tk.BOTH, expand=True, padx=12)
+        # Only a preview goes into the Text widget; the rest is loaded the
+        # first time the view reaches the bottom. Copy always takes it all.
+        if len(prompt) > PROMPT_PREVIEW_CHARS:
+            txt.insert(tk.END, prompt[:PROMPT_PREVIEW_CHARS], (), f"\n\n[...{len(prompt) - PROMPT_PREVIEW_CHARS:,} more chars \u2014 scroll down to load, or copy to get all]", "more")
+            txt.tag_configure("more", foreground=COLORS["text_dim"])
+            sb_set = txt.vbar.set
+            def on_scroll(first, last):
+                sb_set(first, last)
+                if float(last) >= 1.0 and txt.tag_ranges("more"):
+                    txt.configure(state=tk.NORMAL, yscrollcommand=sb_set)
+                    txt.delete("more.first", "more.last"); txt.insert(tk.END, prompt[PROMPT_PREVIEW_CHARS:])
+                    txt.configure(state=tk.DISABLED)
+            txt.configure(yscrollcommand=on_scroll)
+        else: txt.insert(tk.END, prompt)
+        txt.configure(state=tk.DISABLED)
         bf = tk.Frame(win, bg=COLORS["bg_dark"]); bf.pack(fill=tk.X, padx=12, pady=12)
         def copy_prompt():
             win.clipboard_clear(); win.clipboard_append(prompt)
@@ -720,6 +1162,7 @@ class MacrosGUI:
         ttk.Button(bf, text="Close", style="Small.TButton", command=win.destroy).pack(side=tk.RIGHT)
 
     def _import_response(self):
+        if self._busy(): return
         if response_exists():
             if messagebox.askyesno("Response Found", "Found claude_response.json in data folder.\nImport from file?\n\n(No = paste text instead)"):
                 self._do_import_file(); return
@@ -729,23 +1172,23 @@ class MacrosGUI:
         win = tk.Toplevel(self.root); win.title("Import Claude Response"); win.configure(bg=COLORS["bg_dark"]); win.geometry("800x600")
         ttk.Label(win, text="PASTE CLAUDE'S RESPONSE BELOW", style="Header.TLabel").pack(pady=(12,4))
         ttk.Label(win, text="Copy Claude's JSON response and paste it here", style="Dim.TLabel").pack(pady=(0,8))
-        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=("Consolas",9), bg=COLORS["bg_entry"], fg=COLORS["text"], insertbackground=COLORS["text"], relief=tk.FLAT, padx=12, pady=12, height=20)
+        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=F9, bg=COLORS["bg_entry"], fg=COLORS["text"], insertbackground=COLORS["text"], relief=tk.FLAT, padx=12, pady=12, height=20)
         txt.pack(fill=tk.BOTH, expand=True, padx=12)
         bf = tk.Frame(win, bg=COLORS["bg_dark"]); bf.pack(fill=tk.X, padx=12, pady=12)
         def do_import():
             raw = txt.get("1.0", tk.END).strip()
             if not raw: messagebox.showwarning("Empty", "Paste Claude's response first.", parent=win); return
+            if self._busy(): return
             try:
                 resp = parse_pasted_response(raw)
                 if "responses" not in resp: messagebox.showerror("Invalid", "JSON doesn't contain 'responses' array.", parent=win); return
                 entries = apply_response(self.state, resp); self._log_import(entries)
-                self.pending_llm_requests = []; self.day_logs = []; _clear_pending_file(); self._refresh_all(); win.destroy()
+                self.pending_llm_requests = []; self.day_logs = []; self._submit_io(_clear_pending_file); self._refresh_all(); win.destroy()
             except json.JSONDecodeError as e:
                 messagebox.showerror("Parse Error", f"Could not parse JSON:\n{str(e)[:200]}\n\nMake sure you copied the complete JSON response.", parent=win)
             except Exception as e: messagebox.showerror("Import Error", str(e), parent=win)
         def load_file():
-            dd = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-            fp = filedialog.askopenfilename(title="Load Response File", initialdir=dd, filetypes=[("JSON","*.json"),("All","*.*")], parent=win)
+            fp = filedialog.askopenfilename(title="Load Response File", initialdir=_DATA_DIR, filetypes=[("JSON","*.json"),("All","*.*")], parent=win)
             if not fp: return
             try:
                 with open(fp,"r",encoding="utf-8") as f: content = f.read()
@@ -760,27 +1203,31 @@ class MacrosGUI:
             resp = read_response()
             if not resp: messagebox.showinfo("No Response", "No response file found."); return
             entries = apply_response(self.state, resp); self._log_import(entries)
-            self.pending_llm_requests = []; self.day_logs = []; _clear_pending_file(); self._refresh_all()
+            self.pending_llm_requests = []; self.day_logs = []; self._submit_io(_clear_pending_file); self._refresh_all()
         except Exception as e: messagebox.showerror("Import Error", str(e))
 
     def _log_import(self, entries):
-        self._log(f"\u2554{'=' * 37}\u2557", "claude")
-        self._log(f"\u2551  CLAUDE RESPONSE IMPORTED           \u2551", "claude")
-        self._log(f"\u255a{'=' * 37}\u255d", "claude")
+        lines = [
+            (BOX_TOP, "claude"),
+            (f"\u2551  CLAUDE RESPONSE IMPORTED           \u2551", "claude"),
+            (BOX_BOTTOM, "claude"),
+        ]
+        add = lines.append
         for e in entries:
-            if "content_preview" in e: self._log(f"  \U0001f916 [{e['type']}] {e['content_preview']}", "claude")
+            if "content_preview" in e: add((f"  \U0001f916 [{e['type']}] {e['content_preview']}", "claude"))
             elif e.get("applied") == "clock_advance":
-                r = e["result"]; self._log(f"     \u2192 {r['clock']}: {r['old']}\u2192{r['new']}", "clock_advance")
+                r = e["result"]; add((f"     \u2192 {r['clock']}: {r['old']}\u2192{r['new']}", "clock_advance"))
             elif e.get("applied") == "clock_reduce":
-                r = e["result"]; self._log(f"     \u2192 {r['clock']}: reduced", "clock_advance")
-            elif e.get("applied") == "fact": self._log(f"     \U0001f4cc {e['text'][:60]}", "dim")
-            elif e.get("error"): self._log(f"     \u274c {e['error']}", "trigger")
-        self._log(f"  \u2705 Applied. Queue cleared.", "claude"); self._log("")
+                r = e["result"]; add((f"     \u2192 {r['clock']}: reduced", "clock_advance"))
+            elif e.get("applied") == "fact": add((f"     \U0001f4cc {_clip(e['text'], 60)}", "dim"))
+            elif e.get("error"): add((f"     \u274c {e['error']}", "trigger"))
+        lines += [(f"  \u2705 Applied. Queue cleared.", "claude"), ("", None)]
+        self._log_batch(lines)
 
     def _show_mcp_setup(self):
-        instructions, cj = generate_mcp_config()
+        instructions, cj = _mcp_config()
         win = tk.Toplevel(self.root); win.title("MCP Setup"); win.configure(bg=COLORS["bg_dark"]); win.geometry("750x600")
-        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=("Consolas",9), bg=COLORS["bg_medium"], fg=COLORS["text"], relief=tk.FLAT, padx=12, pady=12)
+        txt = scrolledtext.ScrolledText(win, wrap=tk.WORD, font=F9, bg=COLORS["bg_medium"], fg=COLORS["text"], relief=tk.FLAT, padx=12, pady=12)
         txt.pack(fill=tk.BOTH, expand=True, padx=12, pady=12); txt.insert(tk.END, instructions); txt.configure(state=tk.DISABLED)
         bf = tk.Frame(win, bg=COLORS["bg_dark"]); bf.pack(fill=tk.X, padx=12, pady=(0,12))
         def cp(): win.clipboard_clear(); win.clipboard_append(cj); self._log("\U0001f4cb MCP config copied", "engine")
@@ -788,22 +1235,41 @@ class MacrosGUI:
         ttk.Button(bf, text="Close", style="Small.TButton", command=win.destroy).pack(side=tk.RIGHT)
 
     def _save_state(self):
-        dd = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"); os.makedirs(dd, exist_ok=True)
+        if self._busy(): return
+        dd = _DATA_DIR; os.makedirs(dd, exist_ok=True)
         fn = os.path.join(dd, f"save_{self.state.in_game_date.replace(' ', '_')}.json")
-        with open(fn, "w") as f: f.write(state_to_json(self.state))
-        self._last_save_mtime = os.path.getmtime(fn)
+        # Same state revision already written to this file, and nobody has
+        # rewritten it since: skip serializing and writing it again.
+        try: fresh = self._saved_as == (self._state_rev, fn) and os.stat(fn).st_mtime_ns == self._last_save_mtime_ns
+        except OSError: fresh = False
+        if fresh: self._saved(fn); return
+        # Serialize here (the state lives on this thread), write on the IO thread
+        rev = self._state_rev
+        fut = self._io_executor.submit(_write_save, fn, state_to_json(self.state))
+        fut.add_done_callback(lambda f: self._call_on_tk(self._save_written, f, fn, rev))
+
+    def _save_written(self, fut, fn, rev):
+        e = fut.exception()
+        if e is not None:
+            self._log(f"\u274c Save failed: {e}", "trigger"); messagebox.showerror("Save Error", str(e)); return
+        self._last_save_mtime_ns = fut.result()
+        self._saved_as = (rev, fn)
+        self._saved(fn)
+
+    def _saved(self, fn):
         self._log(f"\U0001f4be Saved: {os.path.basename(fn)}", "engine")
         messagebox.showinfo("Saved", f"Saved to {os.path.basename(fn)}")
 
     def _load_state(self):
-        dd = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+        if self._busy(): return
+        dd = _DATA_DIR
         if not os.path.isdir(dd): dd = "."
         fp = filedialog.askopenfilename(title="Load Save", initialdir=dd, filetypes=[("JSON","*.json"),("All","*.*")])
         if not fp: return
         try:
-            with open(fp, "r") as f: self.state = state_from_json(f.read())
-            self.pending_llm_requests = []; self.day_logs = []; _clear_pending_file()
-            self._last_save_mtime = os.path.getmtime(fp)
+            with open(fp, "rb") as f: self.state = state_from_json(f.read())
+            self.pending_llm_requests = []; self.day_logs = []; self._submit_io(_clear_pending_file)
+            self._last_save_mtime_ns = os.stat(fp).st_mtime_ns
             self._refresh_all()
             self.log_text.configure(state=tk.NORMAL); self.log_text.delete("1.0", tk.END); self.log_text.configure(state=tk.DISABLED)
             self._log(f"\U0001f4c2 Loaded: {os.path.basename(fp)}", "engine")
@@ -812,8 +1278,9 @@ class MacrosGUI:
         except Exception as e: messagebox.showerror("Load Error", str(e))
 
     def _reset_state(self):
+        if self._busy(): return
         if messagebox.askyesno("Reset", "Reset to Session 7?\nDiscards unsaved changes."):
-            self.state = load_gammaria_state(); self.pending_llm_requests = []; self.day_logs = []; _clear_pending_file()
+            self.state = load_gammaria_state(); self.pending_llm_requests = []; self.day_logs = []; self._submit_io(_clear_pending_file)
             self._refresh_all(); self._log("\U0001f504 Reset to Session 7", "header")
 
     def _roll_d6(self):
@@ -821,13 +1288,48 @@ class MacrosGUI:
     def _roll_2d6(self):
         r = roll_dice("2d6"); self._log(f"  \U0001f3b2 2d6 = {r['dice']} = {r['total']}", "dice")
 
-    def _refresh_all(self):
-        self._update_meta()
+    def _tab_fingerprints(self):
+        """Cheap per-tab summaries of what each tab renders; a tab whose
+        summary is unchanged keeps its rows and is not redrawn."""
+        s = self.state
+        return (
+            (tuple((c.name, c.progress, c.max_progress, c.status, c.trigger_fired, c.is_cadence) for c in s.clocks.values()),
+             tuple((e.name, e.status, e.version) for e in s.engines.values())),
+            tuple((n.name, n.zone, n.role, n.status, n.with_pc, n.is_companion) for n in s.npcs.values()),
+            tuple((f.name, f.disposition, f.status, f.notes) for f in s.factions.values()),
+            _fingerprint_world(s),
+        )
+
+    def _draw_clocks_tab(self):
         self._draw_clocks()
         self._draw_engines()
-        self._draw_npcs()
-        self._draw_factions()
-        self._draw_world()
+
+    def _draw_visible_tab(self, _event=None):
+        i = self.notebook.index("current")
+        if not self._tab_built[i]:
+            self._tab_built[i] = True
+            self._tab_build[i](self._tabs[i])
+        if i in self._dirty and self._worker is None:
+            self._dirty.discard(i)
+            self._tab_draw[i]()
+
+    def _refresh_all(self):
+        """Note a state change now and redraw once the event queue is idle,
+        so back-to-back changes (reload bursts, import + queue clear) draw
+        only once."""
+        self._state_rev += 1
+        if self._refresh_pending: return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._update_meta()
+        for i, fp in enumerate(self._tab_fingerprints()):
+            if fp != self._tab_fps[i]:
+                self._tab_fps[i] = fp
+                self._dirty.add(i)
+        self._draw_visible_tab()
         self._update_pending()
 
     def run(self):
@@ -7,33 +7,46 @@ Lazy singleton: loads once on first access, cached for session lifetime.
 import os
 import re
 import logging
+import marshal
 
 logger = logging.getLogger("macros.lore")
 
 # ─────────────────────────────────────────────────────
-# ALL-CAPS HEADER REGEX
-# Matches lines like "BARROW MOORS", "FISHER'S BEACH", "FORT SEAWATCH - DOCKS AND ALLEYS"
+# SECTION HEADER REGEXES
+# Each parser runs one pattern over the whole file, prefixed with "\n".
+# Line patterns begin with that literal newline, so the regex engine jumps
+# from line to line instead of trying every character, and end at (?=\n|\Z).
+# [^\S\n] is "whitespace but not newline": headers are matched with their
+# surrounding blanks ignored, and no pattern runs across lines.
 # ─────────────────────────────────────────────────────
-_CAPS_HEADER_RE = re.compile(r"^[A-Z][A-Z\s\'\'\-\&\u2019]+$")
+
+# ALL-CAPS header: "BARROW MOORS", "FISHER'S BEACH", "FORT SEAWATCH - DOCKS AND ALLEYS"
+_CAPS_HEADER_RE = re.compile(r"\n[^\S\n]*([A-Z](?:[^\S\n]*[A-Z\'\-\&\u2019])+)[^\S\n]*(?=\n|\Z)")
 
 # NPC section header: §1 — VALANIA LORETHOR
-_NPC_SECTION_RE = re.compile(r"^§\d+\s*[—\-–]\s*(.+)$")
+_NPC_SECTION_RE = re.compile(r"\n[^\S\n]*§\d+[^\S\n]*[—\-–][^\S\n]*(\S(?:.*\S)?)[^\S\n]*(?=\n|\Z)")
 
 # World section header: [WORLD OVERVIEW]
-_WORLD_SECTION_RE = re.compile(r"^\[([^\]]+)\]$")
+_WORLD_SECTION_RE = re.compile(r"\n[^\S\n]*\[([^\]\n]+)\][^\S\n]*(?=\n|\Z)")
 
-# PARTY-SEED character header
-_SEED_PC_RE = re.compile(r"^PC_Name:\s*(.+)$")
-_SEED_NPC_RE = re.compile(r"^PARTY_NPC_Name:\s*(.+)$")
+# PARTY-SEED character header: PC_Name: / PARTY_NPC_Name:
+_SEED_HEADER_RE = re.compile(r"\n[^\S\n]*(?:PC_Name|PARTY_NPC_Name):[^\S\n]*(\S(?:.*\S)?)[^\S\n]*(?=\n|\Z)")
 
-# BX-PLUG section separator
-_BX_SEPARATOR_RE = re.compile(r"^─{10,}$")
+# BX-PLUG section separator line (also dropped from NPC sections)
+_BX_SEPARATOR_RE = re.compile(r"\n[^\S\n]*─{10,}[^\S\n]*(?=\n|\Z)")
 
 # BX-PLUG major section header (e.g., "0. BX-PLUG MACRO", "1. DATA DEFINITIONS")
 _BX_MAJOR_RE = re.compile(r"^(\d+)\.\s+(.+)")
 
-# Preamble lines to skip (common to lore files)
-_PREAMBLE_MARKERS = ("Source:", "Authority:", "(")
+# Apostrophes in a zone-name word: the first becomes ', later ones are dropped
+_APOSTROPHES_RE = re.compile(r"['\u2019](\S*)")
+_APOSTROPHE_CHARS_RE = re.compile(r"['\u2019]")
+
+# Leading preamble of LORE-PLACES / LORE-FACTIONS: blank lines and lines
+# starting with Source:, Authority:, "(" or the file title. Factions also
+# skips "FOUNDATIONAL FACTIONS (from NSV-FACTIONS)"-style lines.
+_PLACES_PREAMBLE_RE = re.compile(r"(?:\n[^\S\n]*(?:(?:Source:|Authority:|\(|LORE-PLACES).*)?(?=\n|\Z))*")
+_FACTIONS_PREAMBLE_RE = re.compile(r"(?:\n[^\S\n]*(?:(?:Source:|Authority:|LORE-FACTIONS).*|.*\(.*)?(?=\n|\Z))*")
 
 
 # ─────────────────────────────────────────────────────
@@ -51,16 +64,26 @@ class LoreIndex:
         self.party_seed = {}    # character_name -> seed text
         self.forge_specs = {}   # spec_name -> full spec text
         self.bx_sections = {}   # section_number_str -> section text
+        self._ci = {}           # attr name -> _CILookup over that dict
+
+    def _lookup(self, attr: str, key: str) -> str:
+        """Case-insensitive lookup in the named dict; its _CILookup is
+        rebuilt whenever the dict is replaced or changes size."""
+        d = getattr(self, attr)
+        ci = self._ci.get(attr)
+        if ci is None or ci.d is not d or ci.size != len(d):
+            ci = self._ci[attr] = _CILookup(d)
+        return ci.lookup(key)
 
     # ── Lookup helpers ────────────────────────────────
 
     def get_zone_lore(self, zone_name: str) -> str:
         """Return atmosphere text for a zone, case-insensitive."""
-        return _ci_lookup(self.places, zone_name)
+        return self._lookup("places", zone_name)
 
     def get_npc_lore(self, npc_name: str, max_lines: int = 30) -> str:
         """Return NPC backstory, optionally truncated to max_lines."""
-        text = _ci_lookup(self.npcs, npc_name)
+        text = self._lookup("npcs", npc_name)
         if text and max_lines > 0:
             lines = text.strip().split("\n")
             if len(lines) > max_lines:
@@ -69,15 +92,15 @@ class LoreIndex:
 
     def get_faction_lore(self, faction_name: str) -> str:
         """Return faction lore text, case-insensitive."""
-        return _ci_lookup(self.factions, faction_name)
+        return self._lookup("factions", faction_name)
 
     def get_world_section(self, section_key: str) -> str:
         """Return a world lore section by bracket key."""
-        return _ci_lookup(self.world, section_key)
+        return self._lookup("world", section_key)
 
     def get_party_seed(self, character_name: str) -> str:
         """Return PARTY-SEED entry for a character."""
-        return _ci_lookup(self.party_seed, character_name)
+        return self._lookup("party_seed", character_name)
 
     def get_forge_spec(self, forge_name: str) -> str:
         """Return full forge spec text (e.g., 'NPC-FORGE')."""
@@ -97,23 +120,37 @@ class LoreIndex:
 # CASE-INSENSITIVE LOOKUP
 # ─────────────────────────────────────────────────────
 
-def _ci_lookup(d: dict, key: str) -> str:
-    """Case-insensitive dict lookup. Try exact, then lowered, then partial."""
-    if not key:
-        return ""
-    # Exact
-    if key in d:
-        return d[key]
-    # Case-insensitive
-    key_lower = key.lower()
-    for k, v in d.items():
-        if k.lower() == key_lower:
-            return v
-    # Partial match (first name or substring)
-    for k, v in d.items():
-        if key_lower in k.lower():
-            return v
-    return ""
+class _CILookup:
+    """Case-insensitive lookup over one lore dict: try exact, then lowered,
+    then partial (first key containing the lowered query, in dict order).
+    Keys are lowered once here rather than on every query, and partial
+    results are remembered per query."""
+
+    __slots__ = ("d", "size", "lowered", "items", "partial")
+
+    def __init__(self, d: dict):
+        self.d, self.size = d, len(d)
+        self.lowered = {}       # lowered key -> value of the first such key
+        for k, v in d.items():
+            self.lowered.setdefault(k.lower(), v)
+        self.items = [(k.lower(), v) for k, v in d.items()]
+        self.partial = {}       # lowered query -> partial-match result
+
+    def lookup(self, key: str) -> str:
+        if not key:
+            return ""
+        # Exact
+        if key in self.d:
+            return self.d[key]
+        # Case-insensitive
+        key_lower = key.lower()
+        if key_lower in self.lowered:
+            return self.lowered[key_lower]
+        # Partial match (first name or substring)
+        hit = self.partial.get(key_lower)
+        if hit is None:
+            hit = self.partial[key_lower] = next((v for k, v in self.items if key_lower in k), "")
+        return hit
 
 
 # ─────────────────────────────────────────────────────
@@ -133,223 +170,81 @@ def _read_file(path: str) -> str:
         return ""
 
 
-def _is_preamble(line: str) -> bool:
-    """Check if a line is a preamble line (Source:, Authority:, parenthetical)."""
-    stripped = line.strip()
-    return any(stripped.startswith(m) for m in _PREAMBLE_MARKERS)
+def _rstrip_lines(text: str) -> str:
+    """text with each line right-stripped, then stripped as a whole."""
+    return "\n".join(map(str.rstrip, text.split("\n"))).strip()
+
+
+def _sections(header_re, text: str, pos: int = 0, with_header: bool = False):
+    """Yield (header match, body) for each header_re match in text (which
+    starts with "\n") from pos on. A body runs to the next header, and
+    includes the header line itself if with_header."""
+    prev = None
+    for m in header_re.finditer(text, pos):
+        if prev is not None:
+            yield prev, _rstrip_lines(text[prev.start() if with_header else prev.end():m.start()])
+        prev = m
+    if prev is not None:
+        yield prev, _rstrip_lines(text[prev.start() if with_header else prev.end():])
 
 
 def _parse_places(text: str) -> dict:
     """Parse LORE-PLACES: ALL-CAPS headers → atmosphere paragraphs."""
-    result = {}
-    lines = text.split("\n")
-    current_name = None
-    current_lines = []
-    past_preamble = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip empty lines at start and preamble
-        if not past_preamble:
-            if not stripped or _is_preamble(stripped) or stripped.startswith("LORE-PLACES"):
-                continue
-            past_preamble = True
-
-        # Check for ALL-CAPS section header
-        if stripped and _CAPS_HEADER_RE.match(stripped):
-            # Save previous section
-            if current_name:
-                result[current_name] = "\n".join(current_lines).strip()
-            current_name = _normalize_zone_name(stripped)
-            current_lines = []
-        elif current_name is not None:
-            current_lines.append(line.rstrip())
-
-    # Save last section
-    if current_name:
-        result[current_name] = "\n".join(current_lines).strip()
-
-    return result
+    text = "\n" + text
+    start = _PLACES_PREAMBLE_RE.match(text).end()
+    return {_normalize_zone_name(m.group(1)): body
+            for m, body in _sections(_CAPS_HEADER_RE, text, start)}
 
 
 def _normalize_zone_name(caps_name: str) -> str:
     """Convert ALL-CAPS zone name to title case matching game state keys.
     E.g., 'FORT SEAWATCH' → 'Fort Seawatch', 'FISHER'S BEACH' → "Fisher's Beach"
     """
-    # Title case, but handle apostrophes and small words
-    words = caps_name.strip().split()
-    result = []
-    for i, w in enumerate(words):
-        # Handle words with apostrophes
-        if "'" in w or "\u2019" in w:
-            # Split on apostrophe, capitalize first part, lowercase rest
-            parts = re.split(r"[''\u2019]", w)
-            titled = parts[0].capitalize() + "'" + "".join(p.lower() for p in parts[1:])
-            result.append(titled)
-        elif w == "-":
-            result.append("-")
-        elif w == "&":
-            result.append("&")
-        else:
-            result.append(w.capitalize())
-    return " ".join(result)
+    # str.capitalize per word already lowercases after an apostrophe;
+    # only apostrophes themselves need fixing up (first one kept as ').
+    name = " ".join(map(str.capitalize, caps_name.split()))
+    if "'" in name or "\u2019" in name:
+        name = _APOSTROPHES_RE.sub(lambda m: "'" + _APOSTROPHE_CHARS_RE.sub("", m.group(1)), name)
+    return name
 
 
 def _parse_npcs(text: str) -> dict:
     """Parse LORE-NPCS: §N — NAME sections separated by ──── lines."""
-    result = {}
-    lines = text.split("\n")
-    current_name = None
-    current_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Check for section header: §1 — VALANIA LORETHOR
-        m = _NPC_SECTION_RE.match(stripped)
-        if m:
-            # Save previous section
-            if current_name:
-                result[current_name] = "\n".join(current_lines).strip()
-            current_name = m.group(1).strip()
-            # Normalize: "VALANIA LORETHOR" → "Valania Lorethor"
-            current_name = current_name.title()
-            current_lines = []
-            continue
-
-        # Skip separator lines
-        if _BX_SEPARATOR_RE.match(stripped):
-            continue
-
-        if current_name is not None:
-            current_lines.append(line.rstrip())
-
-    # Save last section
-    if current_name:
-        result[current_name] = "\n".join(current_lines).strip()
-
-    return result
+    text = _BX_SEPARATOR_RE.sub("", "\n" + text)
+    # Normalize: "VALANIA LORETHOR" → "Valania Lorethor"
+    return {m.group(1).title(): body for m, body in _sections(_NPC_SECTION_RE, text)}
 
 
 def _parse_factions(text: str) -> dict:
     """Parse LORE-FACTIONS: ALL-CAPS faction names → lore paragraphs."""
-    result = {}
-    lines = text.split("\n")
-    current_name = None
-    current_lines = []
-    past_preamble = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip preamble
-        if not past_preamble:
-            if not stripped or _is_preamble(stripped) or stripped.startswith("LORE-FACTIONS"):
-                continue
-            # "FOUNDATIONAL FACTIONS (from NSV-FACTIONS)" has lowercase — skip it
-            if "(" in stripped:
-                continue
-            past_preamble = True
-
-        # Check for ALL-CAPS section header
-        if stripped and _CAPS_HEADER_RE.match(stripped):
-            if current_name:
-                result[current_name] = "\n".join(current_lines).strip()
-            current_name = stripped.title()
-            current_lines = []
-        elif current_name is not None:
-            current_lines.append(line.rstrip())
-
-    if current_name:
-        result[current_name] = "\n".join(current_lines).strip()
-
-    return result
+    text = "\n" + text
+    start = _FACTIONS_PREAMBLE_RE.match(text).end()
+    return {m.group(1).title(): body for m, body in _sections(_CAPS_HEADER_RE, text, start)}
 
 
 def _parse_world(text: str) -> dict:
     """Parse LORE-WORLD: [SECTION] bracket headers → content."""
     result = {}
-    lines = text.split("\n")
-    current_section = None
-    current_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-
-        m = _WORLD_SECTION_RE.match(stripped)
-        if m:
-            if current_section:
-                result[current_section] = "\n".join(current_lines).strip()
-            current_section = m.group(1).strip()
-            current_lines = []
-        elif current_section is not None:
-            current_lines.append(line.rstrip())
-
-    if current_section:
-        result[current_section] = "\n".join(current_lines).strip()
-
+    for m, body in _sections(_WORLD_SECTION_RE, "\n" + text):
+        section = m.group(1).strip()
+        if section:
+            result[section] = body
     return result
 
 
 def _parse_party_seed(text: str) -> dict:
-    """Parse PARTY-SEED: PC_Name: / PARTY_NPC_Name: delimiters."""
-    result = {}
-    lines = text.split("\n")
-    current_name = None
-    current_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Check for PC header
-        m = _SEED_PC_RE.match(stripped)
-        if m:
-            if current_name:
-                result[current_name] = "\n".join(current_lines).strip()
-            current_name = m.group(1).strip()
-            current_lines = [line.rstrip()]
-            continue
-
-        # Check for NPC header
-        m = _SEED_NPC_RE.match(stripped)
-        if m:
-            if current_name:
-                result[current_name] = "\n".join(current_lines).strip()
-            current_name = m.group(1).strip()
-            current_lines = [line.rstrip()]
-            continue
-
-        if current_name is not None:
-            current_lines.append(line.rstrip())
-
-    if current_name:
-        result[current_name] = "\n".join(current_lines).strip()
-
-    return result
+    """Parse PARTY-SEED: PC_Name: / PARTY_NPC_Name: delimiters. Each entry
+    keeps its header line."""
+    return {m.group(1): body for m, body in _sections(_SEED_HEADER_RE, "\n" + text, with_header=True)}
 
 
 def _parse_bx_plug(text: str) -> dict:
     """Parse BX-PLUG.txt: split on ──── separators, key by major section number."""
     result = {}
-    lines = text.split("\n")
-    chunks = []
-    current_chunk = []
-
-    for line in lines:
-        if _BX_SEPARATOR_RE.match(line.strip()):
-            if current_chunk:
-                chunks.append("\n".join(current_chunk))
-                current_chunk = []
-        else:
-            current_chunk.append(line.rstrip())
-
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
 
     # Key each chunk by its first major section number
-    for chunk in chunks:
-        stripped = chunk.strip()
+    for chunk in _BX_SEPARATOR_RE.split("\n" + text):
+        stripped = _rstrip_lines(chunk)
         if not stripped:
             continue
         m = _BX_MAJOR_RE.match(stripped)
@@ -378,40 +273,55 @@ _FORGE_SPEC_FILES = [
     "ZONE-FORGE.txt",
 ]
 
+# (file, LoreIndex attribute, parser, log noun) for the sectioned files
+_LORE_FILES = [
+    ("LORE-PLACES v1.0.txt", "places", _parse_places, "place entries"),
+    ("LORE-NPCS v2.0.txt", "npcs", _parse_npcs, "NPC entries"),
+    ("LORE-FACTIONS v1.0.txt", "factions", _parse_factions, "faction entries"),
+    ("LORE-WORLD v1.0.txt", "world", _parse_world, "world sections"),
+    ("PARTY-SEED.txt", "party_seed", _parse_party_seed, "party seed entries"),
+]
 
-def _load_index(docs_dir: str) -> LoreIndex:
-    """Load and parse all lore files from docs_dir."""
-    idx = LoreIndex()
+_BX_PLUG_FILE = "BX-PLUG.txt"
 
-    # LORE-PLACES
-    text = _read_file(os.path.join(docs_dir, "LORE-PLACES v1.0.txt"))
-    if text:
-        idx.places = _parse_places(text)
-        logger.info(f"Lore: loaded {len(idx.places)} place entries")
 
-    # LORE-NPCS
-    text = _read_file(os.path.join(docs_dir, "LORE-NPCS v2.0.txt"))
-    if text:
-        idx.npcs = _parse_npcs(text)
-        logger.info(f"Lore: loaded {len(idx.npcs)} NPC entries")
+def _lore_paths(docs_dir: str) -> list:
+    """Every file _load_index reads, in read order."""
+    names = [f for f, _, _, _ in _LORE_FILES] + _FORGE_SPEC_FILES + [_BX_PLUG_FILE]
+    return [os.path.join(docs_dir, f) for f in names]
 
-    # LORE-FACTIONS
-    text = _read_file(os.path.join(docs_dir, "LORE-FACTIONS v1.0.txt"))
-    if text:
-        idx.factions = _parse_factions(text)
-        logger.info(f"Lore: loaded {len(idx.factions)} faction entries")
 
-    # LORE-WORLD
-    text = _read_file(os.path.join(docs_dir, "LORE-WORLD v1.0.txt"))
-    if text:
-        idx.world = _parse_world(text)
-        logger.info(f"Lore: loaded {len(idx.world)} world sections")
+def _prefetch(paths: list):
+    """Start kernel readahead for every file at once (POSIX_FADV_WILLNEED),
+    so on a cold cache the disk reads overlap instead of each _read_file
+    waiting for its own. No-op where posix_fadvise is missing (Windows,
+    macOS)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-    # PARTY-SEED
-    text = _read_file(os.path.join(docs_dir, "PARTY-SEED.txt"))
-    if text:
-        idx.party_seed = _parse_party_seed(text)
-        logger.info(f"Lore: loaded {len(idx.party_seed)} party seed entries")
+
+def _load_index(docs_dir: str) -> LoreIndex:
+    """Load and parse all lore files from docs_dir."""
+    idx = LoreIndex()
+    _prefetch(_lore_paths(docs_dir))
+
+    # LORE-PLACES, LORE-NPCS, LORE-FACTIONS, LORE-WORLD, PARTY-SEED
+    for fname, attr, parse, noun in _LORE_FILES:
+        text = _read_file(os.path.join(docs_dir, fname))
+        if text:
+            setattr(idx, attr, parse(text))
+            logger.info(f"Lore: loaded {len(getattr(idx, attr))} {noun}")
 
     # Forge specs (loaded in full)
     for fname in _FORGE_SPEC_FILES:
@@ -422,7 +332,7 @@ def _load_index(docs_dir: str) -> LoreIndex:
     logger.info(f"Lore: loaded {len(idx.forge_specs)} forge specs")
 
     # BX-PLUG sections
-    text = _read_file(os.path.join(docs_dir, "BX-PLUG.txt"))
+    text = _read_file(os.path.join(docs_dir, _BX_PLUG_FILE))
     if text:
         idx.bx_sections = _parse_bx_plug(text)
         logger.info(f"Lore: loaded {len(idx.bx_sections)} BX-PLUG sections")
@@ -430,6 +340,86 @@ def _load_index(docs_dir: str) -> LoreIndex:
     return idx
 
 
+# ─────────────────────────────────────────────────────
+# ON-DISK CACHE
+# The parsed dicts are plain str -> str, so they go to docs/ as one
+# marshal blob, keyed by (path, mtime_ns, size) of every lore file.
+# ─────────────────────────────────────────────────────
+
+_CACHE_FILE = ".lore_index.cache"
+
+# Bump whenever a _parse_* function, _LORE_FILES or _CACHED_ATTRS changes,
+# so caches written by the old code are rebuilt.
+_CACHE_VERSION = 1
+
+_CACHED_ATTRS = ("places", "npcs", "factions", "world", "party_seed",
+                 "forge_specs", "bx_sections")
+
+
+def _lore_signature(paths: list) -> tuple:
+    """(path, mtime_ns, size) for each lore file, None for a missing one,
+    led by the cache and marshal format versions."""
+    sig = [_CACHE_VERSION, marshal.version]
+    for path in paths:
+        try:
+            st = os.stat(path)
+            sig.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((path, None, None))
+    return tuple(sig)
+
+
+def _read_cache(cache_path: str, sig: tuple):
+    """Return the cached LoreIndex if its signature matches, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_sig, data = marshal.load(f)
+        if cached_sig != sig:
+            return None
+        attrs = [(attr, data[attr]) for attr in _CACHED_ATTRS]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable lore cache {cache_path}: {e}")
+        return None
+    idx = LoreIndex()
+    for attr, value in attrs:
+        setattr(idx, attr, value)
+    return idx
+
+
+def _write_cache(cache_path: str, sig: tuple, idx: LoreIndex):
+    """Write the cache via a temp file + os.replace. A failed write only
+    costs a re-parse next start."""
+    data = {attr: getattr(idx, attr) for attr in _CACHED_ATTRS}
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            marshal.dump((sig, data), f)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        logger.info(f"Lore cache not written ({cache_path}): {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _load_index_cached(docs_dir: str) -> LoreIndex:
+    """_load_index, skipped when docs/.lore_index.cache is up to date.
+    The signature is taken before parsing, so a file edited mid-parse
+    just mismatches next time."""
+    cache_path = os.path.join(docs_dir, _CACHE_FILE)
+    sig = _lore_signature(_lore_paths(docs_dir))
+    idx = _read_cache(cache_path, sig)
+    if idx is not None:
+        logger.info(f"Lore: loaded index from {cache_path}")
+        return idx
+    idx = _load_index(docs_dir)
+    _write_cache(cache_path, sig, idx)
+    return idx
+
+
 # ─────────────────────────────────────────────────────
 # PUBLIC API
 # ─────────────────────────────────────────────────────
@@ -443,7 +433,7 @@ def get_lore_index(docs_dir: str = None) -> LoreIndex:
     if _index is None:
         if docs_dir is None:
             docs_dir = os.path.join(os.path.dirname(__file__), "docs")
-        _index = _load_index(docs_dir)
+        _index = _load_index_cached(docs_dir)
     return _index
 
 
@@ -829,7 +829,7 @@ def update_npc(
             "event": history_event,
         })
 
-    state.npcs[name] = npc
+    state.add_npc(npc)
     action = "Created" if is_new else "Updated"
     state.log({"type": "NPC_FORGE" if is_new else "NPC_UPDATE",
                "detail": f"{action}: {name} @ {npc.zone} | {npc.role} | {npc.trait}"})
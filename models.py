@@ -19,10 +19,15 @@ v2.0 changes:
 
 import json
 import random
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional
 from enum import Enum
 
+try:
+    import orjson as _orjson        # optional: C parser for multi-MB saves
+except ImportError:
+    _orjson = None
+
 
 # ─────────────────────────────────────────────────────
 # ENUMS
@@ -232,7 +237,7 @@ class Zone:
 # NPC (v2.0 — replaces delta NPC_STATE_CHANGES)
 # ─────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     """A named NPC with full state tracking."""
     name: str
@@ -274,6 +279,66 @@ class NPC:
     history: list = field(default_factory=list)
     # Each entry: {"session": N, "date": "...", "event": "description"}
 
+    # Cached web UI row — runtime only, left out of to_dict()
+    _ui_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_ui_cache":
+            object.__setattr__(self, "_ui_cache", None)
+
+    def to_dict(self) -> dict:
+        """Serializable fields (no runtime cache). Values are not copied."""
+        return {name: getattr(self, name) for name in _NPC_FIELDS}
+
+    def ui_dict(self) -> dict:
+        """Web UI row for this NPC (companion rows carry the PARTY tab fields).
+        Cached until any field is reassigned or history grows."""
+        cached = self._ui_cache
+        if cached is not None and cached[0] == len(self.history):
+            return cached[1]
+        nd = {
+            "name": self.name, "zone": self.zone, "status": self.status,
+            "role": self.role, "trait": self.trait, "faction": self.faction,
+            "with_pc": self.with_pc, "is_companion": self.is_companion,
+            "bx_hp": self.bx_hp, "bx_hp_max": self.bx_hp_max,
+        }
+        if self.is_companion:
+            # Full companion data for PARTY tab
+            nd.update({
+                "class_level": self.class_level,
+                "bx_ac": self.bx_ac,
+                "bx_hd": self.bx_hd,
+                "bx_at": self.bx_at,
+                "bx_dmg": self.bx_dmg,
+                "bx_ml": self.bx_ml,
+                "appearance": self.appearance,
+                "objective": self.objective,
+                "knowledge": self.knowledge,
+                "next_action": self.next_action,
+                "history": self.history[-5:] if self.history else [],
+            })
+        else:
+            # DG-28: Include detail fields for expandable NPC rows
+            nd.update({
+                "appearance": self.appearance,
+                "objective": self.objective,
+                "class_level": self.class_level,
+                "bx_ac": self.bx_ac,
+                "bx_hd": self.bx_hd,
+                "bx_at": self.bx_at,
+                "bx_dmg": self.bx_dmg,
+                "bx_ml": self.bx_ml,
+                "knowledge": self.knowledge,
+                "next_action": self.next_action,
+            })
+        object.__setattr__(self, "_ui_cache", (len(self.history), nd))
+        return nd
+
+
+# Serialized NPC fields, in declaration order
+_NPC_FIELDS = tuple(f.name for f in fields(NPC) if f.name != "_ui_cache")
+
 
 # ─────────────────────────────────────────────────────
 # COMPANION DETAIL (v2.0 — replaces PARTY-DELTA)
@@ -476,6 +541,15 @@ class GameState:
     # SESSION LOG
     session_log: list = field(default_factory=list)
 
+    # Runtime only (not serialized): bumped on any zone/CP mutation so
+    # callers can cache derived zone-graph data such as crossing points
+    _zone_version: int = 0
+    # Runtime only: bumped by add_npc; find_npc rebuilds its lower-cased
+    # NPC name -> npcs key index when this has moved since the last build
+    _npc_version: int = 0
+    _npcs_lower: Optional[dict] = None
+    _npcs_lower_version: int = -1
+
     # ── Helpers ──
 
     def get_clock(self, name: str) -> Optional[Clock]:
@@ -487,6 +561,31 @@ class GameState:
     def get_npc(self, name: str) -> Optional[NPC]:
         return self.npcs.get(name)
 
+    def find_npc(self, name: str) -> Optional[NPC]:
+        """Exact lookup, falling back to a case-insensitive match."""
+        npc = self.npcs.get(name)
+        if npc is not None:
+            return npc
+        low = name.lower()
+        idx = self._npcs_lower
+        if idx is None or self._npcs_lower_version != self._npc_version:
+            idx = self._rebuild_npcs_lower()
+        key = idx.get(low)
+        if key is not None and key not in self.npcs:
+            # Entries were removed or renamed behind the index's back
+            key = self._rebuild_npcs_lower().get(low)
+        return self.npcs.get(key) if key is not None else None
+
+    def _rebuild_npcs_lower(self) -> dict:
+        """First key in dict order wins when names differ only in case,
+        as with a linear scan."""
+        idx = {}
+        for k in self.npcs:
+            idx.setdefault(k.lower(), k)
+        self._npcs_lower = idx
+        self._npcs_lower_version = self._npc_version
+        return idx
+
     def get_faction(self, name: str) -> Optional[Faction]:
         return self.factions.get(name)
 
@@ -501,6 +600,7 @@ class GameState:
 
     def add_npc(self, npc: NPC):
         self.npcs[npc.name] = npc
+        self._npc_version += 1
 
     def add_faction(self, faction: Faction):
         self.factions[faction.name] = faction
@@ -553,9 +653,9 @@ class GameState:
 # SERIALIZATION (v2.0)
 # ─────────────────────────────────────────────────────
 
-def state_to_json(state: GameState) -> str:
-    """Serialize complete game state to JSON."""
-    data = {
+def _state_to_dict(state: GameState) -> dict:
+    """Plain-dict form of the complete game state (shared by the encoders)."""
+    return {
         "meta": {
             "session_id": state.session_id,
             "in_game_date": state.in_game_date,
@@ -574,7 +674,7 @@ def state_to_json(state: GameState) -> str:
         },
 
         # v2.0 collections
-        "npcs": {name: asdict(npc) for name, npc in state.npcs.items()},
+        "npcs": {name: npc.to_dict() for name, npc in state.npcs.items()},
         "companions": {name: asdict(comp) for name, comp in state.companions.items()},
         "factions": {name: asdict(fac) for name, fac in state.factions.items()},
         "relationships": {rid: asdict(rel) for rid, rel in state.relationships.items()},
@@ -598,12 +698,27 @@ def state_to_json(state: GameState) -> str:
         "adjudication_log": state.adjudication_log,
         "session_log": state.session_log,
     }
-    return json.dumps(data, indent=2, ensure_ascii=False)
 
 
-def state_from_json(json_str: str) -> GameState:
-    """Deserialize game state from JSON. Backward-compatible with v1.0 saves."""
-    data = json.loads(json_str)
+def state_to_json(state: GameState) -> str:
+    """Serialize complete game state to JSON."""
+    return json.dumps(_state_to_dict(state), indent=2, ensure_ascii=False)
+
+
+def state_to_json_bytes(state: GameState) -> bytes:
+    """Serialize complete game state to UTF-8 JSON bytes, ready for a
+    binary-mode write. Uses orjson when available; same layout as
+    state_to_json either way."""
+    data = _state_to_dict(state)
+    if _orjson:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def state_from_json(json_str: str | bytes) -> GameState:
+    """Deserialize game state from JSON. Backward-compatible with v1.0 saves.
+    Accepts str or bytes; bytes let orjson decode UTF-8 itself."""
+    data = _orjson.loads(json_str) if _orjson else json.loads(json_str)
     state = GameState()
 
     # META
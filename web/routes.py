@@ -3,16 +3,23 @@ MACROS Engine v4.0 — FastAPI Routes
 Player-facing endpoints + Creative API for MCP bridge.
 """
 
-import json
+import asyncio
 import os
+import queue
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse
+try:
+    # orjson encodes straight to bytes in C; ORJSONResponse needs it installed
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as JSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 
 from game_loop import GameLoop
-from web.websocket import ConnectionManager
+from web.websocket import ConnectionManager, dumps_text
 
 
 # ─────────────────────────────────────────────────────
@@ -37,14 +44,6 @@ def init_game(data_dir: str = None):
         except RuntimeError:
             pass
 
-    def on_log_entry(entry):
-        import asyncio
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(manager.broadcast("log_entry", entry))
-        except RuntimeError:
-            pass
-
     def on_narration(narr_type, text):
         import asyncio
         try:
@@ -56,8 +55,36 @@ def init_game(data_dir: str = None):
             pass
 
     game._on_phase_change = on_phase_change
-    game._on_log_entry = on_log_entry
     game._on_narration = on_narration
+    game.log_queue = queue.SimpleQueue()
+
+
+# Log entries per log_entries broadcast / idle poll interval (seconds)
+LOG_DRAIN_BATCH = 64
+LOG_DRAIN_INTERVAL = 0.05
+
+
+async def _drain_log_queue():
+    """Forward engine log entries to WebSocket clients in batches. The engine
+    only enqueues, so its tick never waits on network I/O."""
+    while True:
+        q = game.log_queue
+        batch = []
+        while q is not None and len(batch) < LOG_DRAIN_BATCH:
+            try:
+                batch.append(q.get_nowait().ui_dict())
+            except queue.Empty:
+                break
+        if batch:
+            await manager.broadcast("log_entries", {"entries": batch})
+            if len(batch) == LOG_DRAIN_BATCH:
+                continue
+        await asyncio.sleep(LOG_DRAIN_INTERVAL)
+
+
+@app.on_event("startup")
+async def _start_log_drain():
+    asyncio.create_task(_drain_log_queue())
 
 
 # ─────────────────────────────────────────────────────
@@ -99,7 +126,7 @@ async def websocket_endpoint(ws: WebSocket):
     try:
         # Send initial state on connect
         state_data = game.get_full_state()
-        await ws.send_text(json.dumps({"event": "state_update", "data": state_data}))
+        await ws.send_text(dumps_text({"event": "state_update", "data": state_data}))
 
         # Keep connection alive, receive any client messages
         while True:
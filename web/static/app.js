@@ -51,11 +51,15 @@ function handleEvent(event, data) {
         case 'narration':
             addNarration(data.type, data.text);
             break;
-        case 'log_entry':
-            addLogEntry(data);
-            // Mirror to side panel live log
-            addSidePanelLogEntry(document.getElementById('sp-log-feed'), data);
+        case 'log_entries': {
+            // Batched by the engine; mirror each to the side panel live log
+            const feed = document.getElementById('sp-log-feed');
+            for (const entry of data.entries) {
+                addLogEntry(entry);
+                addSidePanelLogEntry(feed, entry);
+            }
             break;
+        }
         case 'creative_pending':
             showWaiting(data.count, data.types);
             break;
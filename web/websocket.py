@@ -7,6 +7,18 @@ import json
 import asyncio
 from fastapi import WebSocket
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def dumps_text(obj) -> str:
+    """JSON text for a WebSocket text frame (orjson when installed)."""
+    if _orjson:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
 
 class ConnectionManager:
     """Manages active WebSocket connections and broadcasts events."""
@@ -24,7 +36,7 @@ class ConnectionManager:
 
     async def broadcast(self, event: str, data: dict = None):
         """Send an event to all connected clients."""
-        message = json.dumps({"event": event, "data": data or {}})
+        message = dumps_text({"event": event, "data": data or {}})
         disconnected = []
         for ws in self.active:
             try:
@@ -89,8 +89,8 @@ def run_zone_forge(state, session_start: bool = False) -> dict:
     # Count active NPCs in this zone
     npcs_in_zone = [
         n for n in state.npcs.values()
-        if getattr(n, "zone", "") == zone_name
-        and getattr(n, "status", "") == "active"
+        if n.zone == zone_name
+        and n.status == "active"
     ]
     npc_count = len(npcs_in_zone)
 